@@ -1,4 +1,5 @@
-from typing import Any, Callable, Mapping, Tuple, Type
+import inspect
+from typing import Any, Callable, Mapping, MutableMapping, Optional, Tuple, Type
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
@@ -8,38 +9,114 @@ from .validation import create_func_model
 
 __all__ = (
     "create_model_cls",
-    "create_model",
     "bind_arguments",
 )
 
 
+class Config:
+    allow_population_by_field_name: bool = True
+    arbitrary_types_allowed: bool = True
+
+
 def create_model_cls(
     func: Callable, fields: Mapping[str, Tuple[Any, FieldInfo]]
 ) -> Type[BaseModel]:
-    class Config:
-        allow_population_by_field_name: bool = True
-        arbitrary_types_allowed: bool = True
-
     return create_func_model(func, fields, config=Config)
 
 
-def create_model(
-    func: Callable,
-    fields: Mapping[str, Tuple[Any, FieldInfo]],
-    arguments: Mapping[str, Any],
-) -> BaseModel:
-    model_cls: Type[BaseModel] = create_model_cls(func, fields)
+def bind_arguments(
+    func: Callable, args: Tuple[Any, ...], kwargs: Mapping[str, Any]
+) -> Mapping[str, Any]:
+    signature_spec: utils.SignatureSpec = utils.get_signature_spec(func)
+
+    # Fast path: most functions take neither `*args` nor `**kwargs`, so can be
+    # bound directly from their cached parameter specs. Anything unexpected
+    # (e.g. a missing or unknown argument) falls back to `Signature.bind`, so
+    # that the usual `TypeError` is raised.
+    if not signature_spec.is_variadic:
+        arguments: Optional[Mapping[str, Any]] = _bind_simple_arguments(
+            signature_spec.parameters, args, kwargs
+        )
+
+        if arguments is not None:
+            return arguments
 
-    return model_cls(**arguments)
+    return _bind_arguments(func, args, kwargs)
 
 
-def bind_arguments(
+def _bind_simple_arguments(
+    parameters: Tuple[utils.ParameterSpec, ...],
+    args: Tuple[Any, ...],
+    kwargs: Mapping[str, Any],
+) -> Optional[Mapping[str, Any]]:
+    if len(args) > len(parameters):
+        return None
+
+    arguments: MutableMapping[str, Any] = {}
+    num_args: int = len(args)
+    num_kwargs: int = 0
+
+    index: int
+    name: str
+    kind: inspect._ParameterKind
+    default: Any
+    for index, (name, kind, default) in enumerate(parameters):
+        value: Any
+
+        if index < num_args:
+            if kind is inspect.Parameter.KEYWORD_ONLY or name in kwargs:
+                return None
+
+            value = args[index]
+        elif name in kwargs:
+            if kind is inspect.Parameter.POSITIONAL_ONLY:
+                return None
+
+            value = kwargs[name]
+            num_kwargs += 1
+        elif default is not inspect.Parameter.empty:
+            value = default
+        else:
+            return None
+
+        if not isinstance(value, FieldInfo):
+            arguments[name] = value
+
+    # Any keyword arguments left over don't match a parameter
+    if num_kwargs != len(kwargs):
+        return None
+
+    return arguments
+
+
+def _bind_arguments(
     func: Callable, args: Tuple[Any, ...], kwargs: Mapping[str, Any]
 ) -> Mapping[str, Any]:
-    arguments: Mapping[str, Any] = utils.bind_arguments(func, args, kwargs)
+    bound_arguments: inspect.BoundArguments = utils.get_signature(func).bind(
+        *args, **kwargs
+    )
+
+    arguments: MutableMapping[str, Any] = {}
+
+    # Apply the defaults and drop any that are parameter specifications (e.g.
+    # `Query()`) in a single pass over the signature, rather than applying all
+    # of the defaults and then filtering them out again.
+    parameter: inspect.Parameter
+    for parameter in bound_arguments.signature.parameters.values():
+        value: Any
+
+        if parameter.name in bound_arguments.arguments:
+            value = bound_arguments.arguments[parameter.name]
+        elif parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            value = ()
+        elif parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            value = {}
+        elif parameter.default is not inspect.Parameter.empty:
+            value = parameter.default
+        else:
+            continue
+
+        if not isinstance(value, FieldInfo):
+            arguments[parameter.name] = value
 
-    return {
-        key: value
-        for key, value in arguments.items()
-        if not isinstance(value, FieldInfo)
-    }
+    return arguments
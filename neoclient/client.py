@@ -20,7 +20,7 @@ from roster import Record
 from typing_extensions import ParamSpec
 
 from . import converters
-from .composition import get_fields, validate_fields
+from .composition import get_model_cls
 from .constants import USER_AGENT
 from .defaults import (
     DEFAULT_AUTH,
@@ -268,8 +268,11 @@ class Client:
                 response_dependencies=response_dependencies,
             )
 
-            # Validate operation function parameters are acceptable
-            validate_fields(get_fields(operation.request_options, func))
+            # Validate operation function parameters are acceptable (the fields
+            # are validated as they are inferred). The model class used to
+            # validate the arguments is also created now, while decorating,
+            # rather than on the first request.
+            get_model_cls(operation.request_options, func)
 
             return operation.wrapper
 
@@ -1,10 +1,19 @@
-import collections.abc
-import dataclasses
+import copy
+import functools
 import inspect
-import typing
 import urllib.parse
-from collections import Counter
-from typing import Any, Callable, Mapping, MutableMapping, MutableSequence, Set, Tuple
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo, ModelField
@@ -23,6 +32,7 @@ from .validation import ValidatedFunction
 
 __all__ = (
     "get_fields",
+    "get_model_cls",
     "validate_fields",
     "compose",
 )
@@ -32,13 +42,92 @@ def get_fields(
     request: RequestOpts,
     func: Callable,
 ) -> Mapping[str, Tuple[Any, Parameter]]:
-    path_params: Set[str] = (
-        utils.parse_format_string(urllib.parse.unquote(str(request.url)))
-        if request is not None
-        else set()
-    )
+    path_params: FrozenSet[str] = _get_request_path_params(request)
+
+    # The fields of a function only depend on its signature and the path
+    # params of the request, so they are only inferred once for each pair.
+    key: Callable = utils.get_cache_key(func)
+
+    if not _is_hashable(key):
+        # The function is unhashable (e.g. a callable instance that defines
+        # `__eq__`), so the fields cannot be cached.
+        return _get_fields(func, path_params)
+
+    return _get_cached_fields(key, path_params)
+
+
+def get_model_cls(request: RequestOpts, func: Callable) -> Type[BaseModel]:
+    path_params: FrozenSet[str] = _get_request_path_params(request)
+
+    # Like the fields, the model class used to validate the arguments only
+    # depends on the function and path params, so it is only created once
+    # for each pair (where possible).
+    key: Callable = utils.get_cache_key(func)
+
+    if not _is_hashable(key):
+        return api.create_model_cls(func, _get_fields(func, path_params))
+
+    return _get_cached_model_cls(key, path_params)
+
+
+def _is_hashable(obj: Any, /) -> bool:
+    try:
+        hash(obj)
+    except TypeError:
+        return False
+
+    return True
+
+
+def _get_request_path_params(request: RequestOpts, /) -> FrozenSet[str]:
+    if request is None:
+        return frozenset()
+
+    return _get_path_params(str(request.url))
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_path_params(url: str, /) -> FrozenSet[str]:
+    # The same request URLs are composed repeatedly, so the URL is unquoted and
+    # parsed once for each URL, rather than on every request.
+    return utils.parse_format_string(urllib.parse.unquote(url))
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cached_fields(
+    func: Callable, path_params: FrozenSet[str], /
+) -> Mapping[str, Tuple[Any, Parameter]]:
+    return _get_fields(func, path_params)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cached_model_cls(
+    func: Callable, path_params: FrozenSet[str], /
+) -> Type[BaseModel]:
+    return api.create_model_cls(func, _get_cached_fields(func, path_params))
+
 
-    validated_function: ValidatedFunction = ValidatedFunction(func)
+def _get_validated_function(func: Callable, /) -> ValidatedFunction:
+    # The same function may be composed with several different sets of path
+    # params (e.g. if the request URL is changed by middleware), so the
+    # validated function is cached separately from the fields.
+    key: Callable = utils.get_cache_key(func)
+
+    if not _is_hashable(key):
+        return ValidatedFunction(func)
+
+    return _get_cached_validated_function(key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cached_validated_function(func: Callable, /) -> ValidatedFunction:
+    return ValidatedFunction(func)
+
+
+def _get_fields(
+    func: Callable, path_params: FrozenSet[str], /
+) -> Mapping[str, Tuple[Any, Parameter]]:
+    validated_function: ValidatedFunction = _get_validated_function(func)
 
     parameters: Mapping[str, inspect.Parameter] = (
         validated_function.signature.parameters
@@ -60,23 +149,9 @@ def get_fields(
                     alias=field_name,
                     default=utils.get_default(field_info),
                 )
-            elif raw_parameter.kind in (
-                inspect.Parameter.VAR_POSITIONAL,
-                inspect.Parameter.VAR_KEYWORD,
-            ):
+            elif raw_parameter.kind in utils.VARIADIC_PARAMETER_KINDS:
                 parameter = QueryParamsParameter()
-            elif (
-                (
-                    isinstance(model_field.annotation, type)
-                    and issubclass(model_field.annotation, (BaseModel, dict))
-                )
-                or dataclasses.is_dataclass(model_field.annotation)
-                or (
-                    utils.is_generic_alias(model_field.annotation)
-                    and typing.get_origin(model_field.annotation)
-                    in (collections.abc.Mapping,)
-                )
-            ):
+            elif utils.is_body_annotation(model_field.annotation):
                 parameter = BodyParameter(
                     alias=field_name,
                     default=utils.get_default(field_info),
@@ -87,49 +162,55 @@ def get_fields(
                     default=utils.get_default(field_info),
                 )
         else:
-            parameter = field_info
+            # Create a clone of the parameter so that any mutations do not
+            # affect the original. Inferred parameters are created above, so
+            # are not shared and can be prepared as-is.
+            parameter = copy.copy(field_info)
 
-        # Create a clone of the parameter so that any mutations do not affect the original
-        parameter_clone: Parameter = dataclasses.replace(parameter)
+        parameter.prepare(model_field)
 
-        parameter_clone.prepare(model_field)
-
-        fields[field_name] = (model_field.annotation, parameter_clone)
+        fields[field_name] = (model_field.annotation, parameter)
 
     total_body_fields: int = sum(
         isinstance(parameter, BodyParameter) for _, parameter in fields.values()
     )
 
     if total_body_fields > 1:
-        field: str
-        annotation: Any
+        # The parameters are already clones, so can be embedded in-place rather
+        # than being cloned again
         param: Parameter
-        for field, (annotation, param) in fields.items():
-            if not isinstance(param, BodyParameter):
-                continue
-
-            param = dataclasses.replace(param, embed=True)
+        for _, param in fields.values():
+            if isinstance(param, BodyParameter):
+                param.embed = True
 
-            fields[field] = (annotation, param)
+    # Validate that the fields are acceptable. This is done here, rather than
+    # when composing, so that it only happens once for each set of fields.
+    validate_fields(fields)
 
-    return fields
+    # The fields may be shared between requests, so are exposed as read-only
+    return MappingProxyType(fields)
 
 
 def validate_fields(fields: Mapping[str, Tuple[Any, Parameter]], /) -> None:
-    parameter_aliases: MutableSequence[str] = [
-        parameter.alias
-        for _, parameter in fields.values()
-        if parameter.alias is not None
-    ]
-
     # Validate that there are no parameters using the same alias
     #   For example, the following function should fail validation:
     #       @get("/")
     #       def foo(a: str = Query(alias="name"), b: str = Query(alias="name")): ...
-    alias_counts: Mapping[str, int] = Counter(parameter_aliases)
-    duplicate_aliases: Set[str] = {
-        alias for alias, count in alias_counts.items() if count > 1
-    }
+    seen_aliases: Set[str] = set()
+    duplicate_aliases: Set[str] = set()
+
+    parameter: Parameter
+    for _, parameter in fields.values():
+        alias: Optional[str] = parameter.alias
+
+        if alias is None:
+            continue
+
+        if alias in seen_aliases:
+            duplicate_aliases.add(alias)
+        else:
+            seen_aliases.add(alias)
+
     if duplicate_aliases:
         raise DuplicateParameters(f"Duplicate parameters: {duplicate_aliases!r}")
 
@@ -142,12 +223,26 @@ def compose(
 ) -> None:
     arguments: Mapping[str, Any] = api.bind_arguments(func, args, kwargs)
 
-    fields: Mapping[str, Tuple[Any, Parameter]] = get_fields(request, func)
+    path_params: FrozenSet[str] = _get_request_path_params(request)
 
-    # Validate that the fields are acceptable
-    validate_fields(fields)
+    fields: Mapping[str, Tuple[Any, Parameter]]
+    model_cls: Type[BaseModel]
+
+    key: Callable = utils.get_cache_key(func)
+
+    if _is_hashable(key):
+        fields = _get_cached_fields(key, path_params)
+        model_cls = _get_cached_model_cls(key, path_params)
+    else:
+        fields = _get_fields(func, path_params)
+        model_cls = api.create_model_cls(func, fields)
+
+    # Functions without any parameters (e.g. `def get_users(): ...`) have
+    # nothing to validate nor compose.
+    if not fields:
+        return
 
-    model: BaseModel = api.create_model(func, fields, arguments)
+    model: BaseModel = model_cls(**arguments)
 
     # By this stage the arguments have been validated
     validated_arguments: Mapping[str, Any] = model.dict()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Mapping, Sequence, Tuple
+from typing import Any, Mapping, Sequence, Union
 
 from httpx import URL, Cookies, Headers, QueryParams, Timeout
 
@@ -21,6 +21,7 @@ from .types import (
     VerifyTypes,
 )
 from .typing import SupportsConsumeClient, SupportsConsumeRequest
+from .utils import is_str
 
 __all__ = (
     "QueryConsumer",
@@ -40,11 +41,52 @@ __all__ = (
     "BaseURLConsumer",
     "VerifyConsumer",
     "FollowRedirectsConsumer",
+    "apply_query_param",
+    "apply_header",
 )
 
 
+def apply_query_param(
+    params: QueryParams, key: str, values: Union[str, Sequence[str]], /
+) -> QueryParams:
+    # A lone string is a single value that has not been wrapped in a sequence
+    if is_str(values):
+        return params.set(key, values)
+
+    # If there's only one value, set the query param and overwrite any
+    # existing entries for this key
+    if len(values) == 1:
+        return params.set(key, values[0])
+
+    # Otherwise, update the query params and maintain any existing entries for
+    # this key
+    value: str
+    for value in values:
+        params = params.add(key, value)
+
+    return params
+
+
+def apply_header(
+    headers: Headers, key: str, values: Union[str, Sequence[str]], /
+) -> None:
+    # A lone string is a single value that has not been wrapped in a sequence
+    if is_str(values):
+        headers[key] = values
+    # If there's only one value, set the header and overwrite any existing
+    # entries for this key
+    elif len(values) == 1:
+        headers[key] = values[0]
+    # Otherwise, update the headers and maintain any existing entries for this
+    # key
+    else:
+        headers.update([(key, value) for value in values])
+
+
 @dataclass(init=False)
 class QueryConsumer(SupportsConsumeClient, SupportsConsumeRequest):
+    __slots__ = ("key", "values")
+
     key: str
     values: Sequence[str]
 
@@ -59,22 +101,13 @@ class QueryConsumer(SupportsConsumeClient, SupportsConsumeRequest):
         client.params = self._apply(client.params)
 
     def _apply(self, params: QueryParams, /) -> QueryParams:
-        # If there's only one value, set the query param and overwrite any
-        # existing entries for this key
-        if len(self.values) == 1:
-            return params.set(self.key, self.values[0])
-
-        # Otherwise, update the query params and maintain any existing entries for
-        # this key
-        value: str
-        for value in self.values:
-            params = params.add(self.key, value)
-
-        return params
+        return apply_query_param(params, self.key, self.values)
 
 
 @dataclass(init=False)
 class HeaderConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("key", "values")
+
     key: str
     values: Sequence[str]
 
@@ -89,22 +122,13 @@ class HeaderConsumer(SupportsConsumeRequest, SupportsConsumeClient):
         self._apply(client.headers)
 
     def _apply(self, headers: Headers, /) -> None:
-        # If there's only one value, set the header and overwrite any existing
-        # entries for this key
-        if len(self.values) == 1:
-            headers[self.key] = self.values[0]
-        # Otherwise, update the headers and maintain any existing entries for this
-        # key
-        else:
-            values: Sequence[Tuple[str, str]] = [
-                (self.key, value) for value in self.values
-            ]
-
-            headers.update(values)
+        apply_header(headers, self.key, self.values)
 
 
 @dataclass(init=False)
 class CookieConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("key", "value")
+
     key: str
     value: str
 
@@ -121,6 +145,8 @@ class CookieConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass(init=False)
 class PathConsumer(SupportsConsumeRequest):
+    __slots__ = ("key", "value")
+
     key: str
     value: str
 
@@ -134,6 +160,8 @@ class PathConsumer(SupportsConsumeRequest):
 
 @dataclass(init=False)
 class QueryParamsConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("params",)
+
     params: QueryParams
 
     def __init__(self, params: QueryParamsTypes, /) -> None:
@@ -148,6 +176,8 @@ class QueryParamsConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass(init=False)
 class HeadersConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("headers",)
+
     headers: Headers
 
     def __init__(self, headers: HeadersTypes, /) -> None:
@@ -162,6 +192,8 @@ class HeadersConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass(init=False)
 class CookiesConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("cookies",)
+
     cookies: Cookies
 
     def __init__(self, cookies: CookiesTypes, /) -> None:
@@ -176,6 +208,8 @@ class CookiesConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass
 class PathParamsConsumer(SupportsConsumeRequest):
+    __slots__ = ("path_params",)
+
     path_params: Mapping[str, str]
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -184,6 +218,8 @@ class PathParamsConsumer(SupportsConsumeRequest):
 
 @dataclass
 class ContentConsumer(SupportsConsumeRequest):
+    __slots__ = ("content",)
+
     content: RequestContent
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -192,6 +228,8 @@ class ContentConsumer(SupportsConsumeRequest):
 
 @dataclass
 class DataConsumer(SupportsConsumeRequest):
+    __slots__ = ("data",)
+
     data: RequestData
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -200,6 +238,8 @@ class DataConsumer(SupportsConsumeRequest):
 
 @dataclass
 class FilesConsumer(SupportsConsumeRequest):
+    __slots__ = ("files",)
+
     files: RequestFiles
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -208,6 +248,8 @@ class FilesConsumer(SupportsConsumeRequest):
 
 @dataclass
 class JsonConsumer(SupportsConsumeRequest):
+    __slots__ = ("json",)
+
     json: JsonTypes
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -216,6 +258,8 @@ class JsonConsumer(SupportsConsumeRequest):
 
 @dataclass(init=False)
 class TimeoutConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("timeout",)
+
     timeout: Timeout
 
     def __init__(self, timeout: TimeoutTypes, /) -> None:
@@ -230,6 +274,8 @@ class TimeoutConsumer(SupportsConsumeRequest, SupportsConsumeClient):
 
 @dataclass
 class StateConsumer(SupportsConsumeRequest):
+    __slots__ = ("key", "value")
+
     key: str
     value: Any
 
@@ -239,6 +285,8 @@ class StateConsumer(SupportsConsumeRequest):
 
 @dataclass
 class MountConsumer(SupportsConsumeRequest):
+    __slots__ = ("path",)
+
     path: str
 
     def consume_request(self, request: RequestOpts, /) -> None:
@@ -247,6 +295,8 @@ class MountConsumer(SupportsConsumeRequest):
 
 @dataclass
 class BaseURLConsumer(SupportsConsumeClient):
+    __slots__ = ("base_url",)
+
     base_url: str
 
     def consume_client(self, client: ClientOptions, /) -> None:
@@ -255,6 +305,8 @@ class BaseURLConsumer(SupportsConsumeClient):
 
 @dataclass
 class VerifyConsumer(SupportsConsumeClient):
+    __slots__ = ("verify",)
+
     verify: VerifyTypes
 
     def consume_client(self, client: ClientOptions, /) -> None:
@@ -263,6 +315,8 @@ class VerifyConsumer(SupportsConsumeClient):
 
 @dataclass
 class FollowRedirectsConsumer(SupportsConsumeRequest, SupportsConsumeClient):
+    __slots__ = ("follow_redirects",)
+
     follow_redirects: bool
 
     def consume_request(self, request: RequestOpts, /) -> None:
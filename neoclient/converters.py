@@ -17,7 +17,7 @@ from .types import (
     QueryTypes,
     TimeoutTypes,
 )
-from .utils import is_primitive
+from .utils import is_primitive, is_str
 
 __all__ = (
     "convert_query_param",
@@ -36,7 +36,9 @@ def convert_query_param(value: QueryTypes, /) -> Sequence[str]:
     if isinstance(value, (str, int, float, bool)) or value is None:
         return [primitive_value_to_str(value)]
 
-    if isinstance(value, Sequence):
+    # The common concrete types are listed before the ABC, as `isinstance` stops
+    # at the first match and checking against an ABC is comparatively slow.
+    if isinstance(value, (list, tuple, Sequence)):
         return [primitive_value_to_str(item) for item in value]
 
     raise ConversionError("query param", value)
@@ -46,13 +48,17 @@ def convert_header(value: HeaderTypes, /) -> Sequence[str]:
     if isinstance(value, (str, int, float, bool)) or value is None:
         return [primitive_value_to_str(value)]
 
-    if isinstance(value, Sequence):
+    if isinstance(value, (list, tuple, Sequence)):
         return [primitive_value_to_str(item) for item in value]
 
     raise ConversionError("header", value)
 
 
 def convert_cookie(value: CookieTypes, /) -> str:
+    # Fast path: strings are already converted
+    if is_str(value):
+        return value
+
     if is_primitive(value):
         return primitive_value_to_str(value)
 
@@ -60,10 +66,14 @@ def convert_cookie(value: CookieTypes, /) -> str:
 
 
 def convert_path_param(value: PathTypes, /, *, delimiter: str = "/") -> str:
+    # Fast path: strings are already converted
+    if is_str(value):
+        return value
+
     if isinstance(value, (str, int, float, bool)) or value is None:
         return primitive_value_to_str(value)
 
-    if isinstance(value, Sequence):
+    if isinstance(value, (list, tuple, Sequence)):
         segments: MutableSequence = []
 
         segment: Primitive
@@ -82,10 +92,10 @@ def convert_query_params(value: QueryParamsTypes, /) -> QueryParams:
     if isinstance(value, QueryParams):
         return value
 
-    if isinstance(value, (Mapping, str, bytes)):
+    if isinstance(value, (dict, str, bytes, Mapping)):
         return QueryParams(value)
 
-    if isinstance(value, Sequence):
+    if isinstance(value, (list, tuple, Sequence)):
         if all(isinstance(v, tuple) for v in value):
             return QueryParams([*value])
         elif all(isinstance(v, str) for v in value):
@@ -98,7 +108,7 @@ def convert_headers(value: HeadersTypes, /) -> Headers:
     if isinstance(value, Headers):
         return value
 
-    if isinstance(value, (Mapping, Sequence)):
+    if isinstance(value, (dict, list, tuple, Mapping, Sequence)):
         return Headers(dict(value))
 
     raise ConversionError("headers", value)
@@ -111,7 +121,7 @@ def convert_cookies(value: CookiesTypes, /) -> Cookies:
     if isinstance(value, CookieJar):
         return Cookies(value)
 
-    if isinstance(value, (Mapping, Sequence)):
+    if isinstance(value, (dict, list, tuple, Mapping, Sequence)):
         return Cookies(dict(value))
 
     raise ConversionError("cookies", value)
@@ -120,7 +130,7 @@ def convert_cookies(value: CookiesTypes, /) -> Cookies:
 def convert_path_params(
     path_params: PathParamsTypes, /, *, delimiter: str = "/"
 ) -> MutableMapping[str, str]:
-    if isinstance(path_params, Mapping):
+    if isinstance(path_params, (dict, Mapping)):
         return {
             key: convert_path_param(value, delimiter=delimiter)
             for key, value in path_params.items()
@@ -133,4 +143,7 @@ def convert_path_params(
 
 
 def convert_timeout(value: TimeoutTypes, /) -> Timeout:
+    if isinstance(value, Timeout):
+        return value
+
     return Timeout(value)
@@ -1,10 +1,13 @@
 import collections.abc
-import dataclasses
+import copy
+import functools
 import typing
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
+    FrozenSet,
     Generic,
     Mapping,
     MutableMapping,
@@ -41,13 +44,11 @@ from .validation import ValidatedFunction
 
 T = TypeVar("T")
 
-
-def get_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
-    class Config:
-        allow_population_by_field_name: bool = True
-        arbitrary_types_allowed: bool = True
-
-    infer_lookup: Mapping[Type[Any], Type[Parameter]] = {
+# Parameters inferred from a dependency's annotation. This is built once, rather
+# than each time the fields of a dependency are inferred, and is read-only as
+# the inferred fields are cached.
+INFER_LOOKUP: Mapping[Type[Any], Type[Parameter]] = MappingProxyType(
+    {
         RequestOpts: RequestParameter,
         Request: RequestParameter,
         Response: ResponseParameter,
@@ -59,32 +60,197 @@ def get_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
         Cookies: CookiesParameter,
         State: AllStateParameter,
     }
+)
+
+
+# Types that pydantic validates with nothing more than an `isinstance` check (as
+# arbitrary types), so resolutions of exactly these types need no validation.
+PASS_THROUGH_TYPES: FrozenSet[type] = frozenset(
+    (
+        Request,
+        Response,
+        httpx.Request,
+        httpx.Response,
+        URL,
+        QueryParams,
+        Headers,
+        Cookies,
+        State,
+    )
+)
+
+
+# Marks parameters that have no cached resolution (which may be `None`)
+MISSING: Any = object()
+
+
+# Parameters whose resolution functions are backed by a multi-value mapping
+MULTI_VALUE_PARAMETER_TYPES: Tuple[Type[Parameter], ...] = (
+    QueryParameter,
+    HeaderParameter,
+)
+
+
+def _check_sequence_annotation(annotation: Any, /) -> bool:
+    if annotation is Any:
+        return False
+
+    return annotation in (list, tuple) or (
+        utils.is_generic_alias(annotation)
+        and typing.get_origin(annotation) in (list, tuple, collections.abc.Sequence)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_cached_sequence_annotation(annotation: Any, /) -> bool:
+    return _check_sequence_annotation(annotation)
 
+
+def _is_sequence_annotation(annotation: Any, /) -> bool:
+    # The same annotations are checked each time a dependency is resolved, so
+    # the result is cached for each annotation where possible.
+    try:
+        hash(annotation)
+    except TypeError:
+        return _check_sequence_annotation(annotation)
+
+    return _check_cached_sequence_annotation(annotation)
+
+
+def _get_inferred_parameter_cls(annotation: Any, /) -> Optional[Type[Parameter]]:
+    if not isinstance(annotation, type):
+        return None
+
+    # Walk the annotation's MRO so that subclasses (e.g. of `httpx.Response`)
+    # are inferred the same as their bases, with the most-derived match used.
+    lookup: Callable[[Any], Optional[Type[Parameter]]] = INFER_LOOKUP.get
+
+    base: type
+    for base in annotation.__mro__:
+        parameter_cls: Optional[Type[Parameter]] = lookup(base)
+
+        if parameter_cls is not None:
+            return parameter_cls
+
+    return None
+
+
+def get_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
+    # The fields of a dependency only depend on its signature, so they are
+    # only inferred once for each dependency.
+    key: Callable = utils.get_cache_key(func)
+
+    try:
+        hash(key)
+    except TypeError:
+        # The dependency is unhashable (e.g. a callable instance that defines
+        # `__eq__`), so the fields cannot be cached.
+        return _get_fields(func)
+
+    return _get_cached_fields(key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cached_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
+    return _get_fields(func)
+
+
+@dataclass(frozen=True)
+class ResolutionStep:
+    field_name: str
+    parameter: Parameter
+    # Whether the parameter's resolution function is backed by a multi-value
+    # mapping, but the field only wants the first value within it
+    use_first_value: bool
+    # Whether the field can be omitted from the arguments if unresolved
+    has_default: bool
+    # The field's annotation, if resolutions of it don't need validating
+    pass_through_type: Optional[type]
+
+
+@dataclass(frozen=True)
+class SolvedDependency:
+    # The model class used to validate the resolved arguments
+    model_cls: Type[BaseModel]
+    # How each of the dependency's fields is resolved
+    steps: Sequence[ResolutionStep]
+    # Whether validation can be skipped (e.g. for a dependency that only takes
+    # the response), provided every field resolves to its pass-through type
+    is_pass_through: bool
+
+
+def solve(func: Callable, /) -> SolvedDependency:
+    # Everything about how a dependency is resolved, except the resolutions
+    # themselves, only depends on its signature, so is worked out once for
+    # each dependency (where possible) and looked up with a single cache hit.
+    key: Callable = utils.get_cache_key(func)
+
+    try:
+        hash(key)
+    except TypeError:
+        return _solve(func, _get_fields(func))
+
+    return _get_cached_solved_dependency(key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cached_solved_dependency(func: Callable, /) -> SolvedDependency:
+    return _solve(func, _get_cached_fields(func))
+
+
+def _solve(
+    func: Callable, fields: Mapping[str, Tuple[Any, Parameter]], /
+) -> SolvedDependency:
+    steps: Sequence[ResolutionStep] = _build_resolution_steps(fields)
+
+    return SolvedDependency(
+        model_cls=api.create_model_cls(func, fields),
+        steps=steps,
+        is_pass_through=all(step.pass_through_type is not None for step in steps),
+    )
+
+
+def _build_resolution_steps(
+    fields: Mapping[str, Tuple[Any, Parameter]], /
+) -> Sequence[ResolutionStep]:
+    return tuple(
+        ResolutionStep(
+            field_name=field_name,
+            parameter=parameter,
+            # If the parameter has a resolution function that is backed to a
+            # multi-value mapping (and will yield a sequence of values),
+            # inspect the field's annotation to decide whether to use the
+            # entire sequence, or only the first value within it.
+            use_first_value=isinstance(parameter, MULTI_VALUE_PARAMETER_TYPES)
+            and not _is_sequence_annotation(field_annotation),
+            has_default=utils.has_default(parameter),
+            pass_through_type=(
+                field_annotation if field_annotation in PASS_THROUGH_TYPES else None
+            ),
+        )
+        for field_name, (field_annotation, parameter) in fields.items()
+    )
+
+
+def _get_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
     fields: MutableMapping[str, Tuple[Any, Parameter]] = {}
 
     field_name: str
     model_field: ModelField
     for field_name, model_field in ValidatedFunction(
-        func, config=Config
+        func, config=api.Config
     ).model.__fields__.items():
         field_info: FieldInfo = model_field.field_info
         parameter: Parameter
 
         if not isinstance(field_info, Parameter):
-            if model_field.annotation in infer_lookup:
-                parameter = infer_lookup[model_field.annotation]()
-            elif (
-                (
-                    isinstance(model_field.annotation, type)
-                    and issubclass(model_field.annotation, (BaseModel, dict))
-                )
-                or dataclasses.is_dataclass(model_field.annotation)
-                or (
-                    utils.is_generic_alias(model_field.annotation)
-                    and typing.get_origin(model_field.annotation)
-                    in (collections.abc.Mapping,)
-                )
-            ):
+            inferred_parameter_cls: Optional[Type[Parameter]] = (
+                _get_inferred_parameter_cls(model_field.annotation)
+            )
+
+            if inferred_parameter_cls is not None:
+                parameter = inferred_parameter_cls()
+            elif utils.is_body_annotation(model_field.annotation):
                 parameter = BodyParameter(
                     default=utils.get_default(field_info),
                 )
@@ -93,16 +259,17 @@ def get_fields(func: Callable, /) -> Mapping[str, Tuple[Any, Parameter]]:
                     default=utils.get_default(field_info),
                 )
         else:
-            parameter = field_info
-
-        # Create a clone of the parameter so that any mutations do not affect the original
-        parameter_clone: Parameter = dataclasses.replace(parameter)
+            # Create a clone of the parameter so that any mutations do not
+            # affect the original. Inferred parameters are created above, so
+            # are not shared and can be prepared as-is.
+            parameter = copy.copy(field_info)
 
-        parameter_clone.prepare(model_field)
+        parameter.prepare(model_field)
 
-        fields[field_name] = (model_field.annotation, parameter_clone)
+        fields[field_name] = (model_field.annotation, parameter)
 
-    return fields
+    # The fields may be shared between resolutions, so are exposed as read-only
+    return MappingProxyType(fields)
 
 
 @dataclass
@@ -137,62 +304,46 @@ class DependencyResolver(Generic[T]):
         if cache is None:
             cache = {}
 
-        fields: Mapping[str, Tuple[Any, Parameter]] = get_fields(self.dependency)
-
-        model_cls: Type[BaseModel] = api.create_model_cls(self.dependency, fields)
+        solved_dependency: SolvedDependency = solve(self.dependency)
 
         arguments: MutableMapping[str, Any] = {}
 
-        field_name: str
-        field_annotation: Any
-        parameter: Parameter
-        for field_name, (field_annotation, parameter) in fields.items():
-            resolution: Any
+        # Whether the resolved arguments can be used without being validated
+        is_pass_through: bool = solved_dependency.is_pass_through
 
-            if parameter in cache:
-                resolution = cache[parameter]
-            else:
+        # Whether a request or response is being resolved is the same for
+        # every field, so is only checked once.
+        is_request: bool = isinstance(request_or_response, RequestOpts)
+
+        step: ResolutionStep
+        for step in solved_dependency.steps:
+            parameter: Parameter = step.parameter
+
+            # Hashing a parameter hashes each of its fields, so the cache is
+            # only looked up once, rather than checked and then indexed.
+            resolution: Any = cache.get(parameter, MISSING)
+
+            if resolution is MISSING:
                 cache_parameter: bool = True
 
                 if isinstance(parameter, DependencyParameter):
-                    if isinstance(request_or_response, RequestOpts):
-                        resolution = parameter.resolve_request(
-                            request_or_response,
-                            cache=cache,
-                        )
-                    else:
-                        resolution = parameter.resolve_response(
-                            request_or_response,
-                            cache=cache,
-                        )
+                    # Nested dependencies can resolve either a request or a
+                    # response, so are dispatched to directly.
+                    resolution = parameter.resolve(request_or_response, cache=cache)
 
                     cache_parameter = parameter.use_cache
+                elif is_request:
+                    resolution = parameter.resolve_request(
+                        request_or_response  # type: ignore
+                    )
                 else:
-                    if isinstance(request_or_response, RequestOpts):
-                        resolution = parameter.resolve_request(request_or_response)
-                    else:
-                        resolution = parameter.resolve_response(request_or_response)
-
-                # If the parameter has a resolution function that is backed to
-                # a multi-value mapping (and will yield a sequence of values),
-                # inspect the field's annotation to decide whether to use the
-                # entire sequence, or only the first value within it.
-                if isinstance(parameter, (QueryParameter, HeaderParameter)):
-                    field_annotation_origin: Optional[Any] = typing.get_origin(
-                        field_annotation
+                    resolution = parameter.resolve_response(
+                        request_or_response  # type: ignore
                     )
 
-                    if (
-                        field_annotation is Any
-                        or field_annotation not in (list, tuple)
-                        and (
-                            not utils.is_generic_alias(field_annotation)
-                            or field_annotation_origin
-                            not in (list, tuple, collections.abc.Sequence)
-                        )
-                    ):
-                        if isinstance(resolution, Sequence) and resolution:
-                            resolution = resolution[0]
+                if step.use_first_value:
+                    if isinstance(resolution, Sequence) and resolution:
+                        resolution = resolution[0]
 
                 if cache_parameter:
                     cache[parameter] = resolution
@@ -202,14 +353,26 @@ class DependencyResolver(Generic[T]):
             # the arguments.
             # This is done so that Pydantic will use the default value, rather
             # than complaining that None was used.
-            if resolution is None and utils.has_default(parameter):
+            if resolution is None and step.has_default:
+                # Pydantic needs to fill in the default
+                is_pass_through = False
                 continue
 
-            arguments[field_name] = resolution
+            if is_pass_through and not isinstance(
+                resolution, step.pass_through_type  # type: ignore
+            ):
+                is_pass_through = False
+
+            arguments[step.field_name] = resolution
 
-        model: BaseModel = model_cls(**arguments)
+        validated_arguments: Mapping[str, Any]
+
+        if is_pass_through:
+            validated_arguments = arguments
+        else:
+            model: BaseModel = solved_dependency.model_cls(**arguments)
 
-        validated_arguments: Mapping[str, Any] = model.dict()
+            validated_arguments = model.dict()
 
         args: Tuple[Any, ...]
         kwargs: Mapping[str, Any]
@@ -230,12 +393,7 @@ class DependencyParameter(Parameter):
         *,
         cache: Optional[MutableMapping[Parameter, Any]] = None,
     ) -> Any:
-        if self.dependency is None:
-            raise ResolutionError(
-                f"Cannot resolve parameter {type(self)!r} without a dependency"
-            )
-
-        return DependencyResolver(self.dependency).resolve_request(request, cache=cache)
+        return self.resolve(request, cache=cache)
 
     def resolve_response(
         self,
@@ -243,16 +401,35 @@ class DependencyParameter(Parameter):
         /,
         *,
         cache: Optional[MutableMapping[Parameter, Any]] = None,
+    ) -> Any:
+        return self.resolve(response, cache=cache)
+
+    def resolve(
+        self,
+        request_or_response: Union[RequestOpts, Response],
+        /,
+        *,
+        cache: Optional[MutableMapping[Parameter, Any]] = None,
     ) -> Any:
         if self.dependency is None:
             raise ResolutionError(
                 f"Cannot resolve parameter {type(self)!r} without a dependency"
             )
 
-        return DependencyResolver(self.dependency).resolve_response(
-            response, cache=cache
+        return self._get_resolver(self.dependency).resolve(
+            request_or_response, cache=cache
         )
 
+    def _get_resolver(self, dependency: Callable, /) -> DependencyResolver:
+        # The resolver is stateless, so is reused across resolutions for as
+        # long as the dependency it was built for is unchanged.
+        resolver: Optional[DependencyResolver] = self.__dict__.get("_resolver")
+
+        if resolver is None or resolver.dependency is not dependency:
+            resolver = self.__dict__["_resolver"] = DependencyResolver(dependency)
+
+        return resolver
+
     def prepare(self, field: ModelField, /) -> None:
         if self.dependency is not None:
             return
@@ -1,18 +1,16 @@
-import dataclasses
-import urllib.parse
+import copy
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import (
     Any,
     Callable,
-    Dict,
+    FrozenSet,
     Iterator,
+    KeysView,
     List,
     Mapping,
     MutableMapping,
     Optional,
-    Sequence,
-    Set,
     Union,
 )
 
@@ -51,7 +49,6 @@ from .types import (
     DefaultEncodingTypes,
     EventHooks,
     HeadersTypes,
-    JsonTypes,
     MethodTypes,
     PathParamsTypes,
     ProxiesTypes,
@@ -87,12 +84,13 @@ class State(SimpleNamespace, MutableMapping):
     def __init__(
         self, mapping: Optional[Mapping[str, Any]] = None, /, **kwargs: Any
     ) -> None:
-        arguments: MutableMapping[str, Any] = {}
+        # NOTE: States are created for every request, so the intermediate
+        # mapping is only built when there is something to merge.
+        if mapping is None:
+            super().__init__(**kwargs)
+            return
 
-        if mapping is not None:
-            arguments.update(mapping)
-
-        arguments.update(kwargs)
+        arguments: MutableMapping[str, Any] = {**mapping, **kwargs}
 
         super().__init__(**arguments)
 
@@ -329,7 +327,7 @@ class ClientOptions:
         self.event_hooks = (
             event_hooks if event_hooks is not None else {"request": [], "response": []}
         )
-        self.base_url = URL(base_url)
+        self.base_url = base_url if isinstance(base_url, URL) else URL(base_url)
         self.transport = transport
         self.app = app
         self.trust_env = trust_env
@@ -404,7 +402,7 @@ class BaseRequestOpts:
             if isinstance(method, bytes)
             else method.upper()
         )
-        self.url = URL(url)
+        self.url = url if isinstance(url, URL) else URL(url)
         self.params = (
             converters.convert_query_params(params)
             if params is not None
@@ -422,9 +420,10 @@ class BaseRequestOpts:
         self.json = json
         self.auth = auth
         self.follow_redirects = follow_redirects
-        # NOTE: Should `converters.convert_timeout` be used here?
         self.timeout = (
-            Timeout(timeout) if not isinstance(timeout, UseClientDefault) else None
+            converters.convert_timeout(timeout)
+            if not isinstance(timeout, UseClientDefault)
+            else None
         )
         self.extensions = extensions if extensions is not None else {}
 
@@ -464,14 +463,17 @@ class BaseRequestOpts:
         )
 
     def copy(self) -> Self:
-        return dataclasses.replace(
-            self,
-            timeout=(
-                self.timeout
-                if self.timeout is not None
-                else USE_CLIENT_DEFAULT  #  type: ignore
-            ),
-        )
+        # Shallow copy the request options rather than re-running `__init__`,
+        # as all values have already been converted. Only the mutable
+        # containers are copied, so that mutations to the copy do not affect
+        # the original.
+        request_opts: Self = copy.copy(self)
+
+        request_opts.headers = self.headers.copy()
+        request_opts.cookies = Cookies(self.cookies)
+        request_opts.extensions = {**self.extensions}
+
+        return request_opts
 
     def validate(self) -> None:
         return
@@ -525,23 +527,55 @@ class RequestOpts(BaseRequestOpts):
         )
         self.state = state if state is not None else State()
 
+    def copy(self) -> Self:
+        request_opts: Self = super().copy()
+
+        request_opts.path_params = {**self.path_params}
+        request_opts.state = State(self.state)
+
+        return request_opts
+
     def build(self, client: Optional[Client] = None) -> Request:
-        request_opts: RequestOpts = dataclasses.replace(self, url=self.formatted_url)
+        # Only the URL differs, so a shallow copy is taken instead of using
+        # `dataclasses.replace`, which would re-run `__init__` (and with it,
+        # every conversion) just to swap the URL.
+        request_opts: RequestOpts = copy.copy(self)
+        request_opts.url = self.formatted_url
+        # Converted the same way `__init__` would have, so an unset timeout
+        # still becomes `Timeout(None)` (no timeout), not the client default.
+        request_opts.timeout = converters.convert_timeout(self.timeout)
+
         request: httpx.Request = BaseRequestOpts.build(request_opts, client)
 
         return Request.from_httpx_request(request, state=self.state)
 
     @property
     def formatted_url(self) -> URL:
+        # Fast path: without any path params or placeholders there is nothing
+        # to format, so the URL can be used as-is rather than being serialised,
+        # formatted and parsed all over again.
+        if not self.path_params and not self._has_placeholders():
+            return self.url
+
         # NOTE: Does URL encoding affect this?
         return URL(str(self.url).format(**self.path_params))
 
-    def validate(self):
-        # NOTE: Does URL encoding affect this?
+    def _has_placeholders(self) -> bool:
+        # The whole URL is checked, as placeholders may be anywhere in it (e.g.
+        # in the host), not just in the path.
         url: str = str(self.url)
 
-        expected_path_params: Set[str] = utils.parse_format_string(url)
-        actual_path_params: Set[str] = set(self.path_params.keys())
+        return "{" in url or "}" in url
+
+    def validate(self):
+        # Fast path: a URL without any placeholders expects no path params, so
+        # doesn't need to be serialised and parsed to find out.
+        if not self.path_params and not self._has_placeholders():
+            return
+
+        # NOTE: Does URL encoding affect this?
+        expected_path_params: FrozenSet[str] = utils.parse_format_string(str(self.url))
+        actual_path_params: KeysView[str] = self.path_params.keys()
 
         # Validate path params are correct
         if expected_path_params != actual_path_params:
@@ -6,11 +6,11 @@ from types import FunctionType, MethodType
 from typing import Any, Callable, Generic, MutableSequence, Optional, TypeVar
 
 import httpx
-import pydantic
 from httpx import Client
 from pydantic import BaseModel
 from typing_extensions import ParamSpec
 
+from . import utils
 from .composition import compose
 from .errors import NotAnOperationError
 from .middleware import Middleware
@@ -58,6 +58,14 @@ class Operation(Generic[PS, RT_co]):
     middleware: Middleware = field(default_factory=Middleware)
     request_dependencies: MutableSequence[Dependency] = field(default_factory=list)
     response_dependencies: MutableSequence[Dependency] = field(default_factory=list)
+    return_annotation: Any = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Inspecting the signature is expensive, so the return annotation is
+        # read once upfront rather than on every call. The (cached) signature
+        # is shared with argument binding, and with any re-bound copies of
+        # this operation (e.g. `Client.bind`).
+        self.return_annotation = utils.get_signature(self.func).return_annotation
 
     def __call__(self, *args: PS.args, **kwargs: PS.kwargs) -> Any:
         client: Client
@@ -86,7 +94,7 @@ class Operation(Generic[PS, RT_co]):
 
         request: Request = pre_request.build(client)
 
-        return_annotation: Any = inspect.signature(self.func).return_annotation
+        return_annotation: Any = self.return_annotation
 
         if return_annotation is RequestOpts:
             return pre_request
@@ -128,7 +136,7 @@ class Operation(Generic[PS, RT_co]):
             if return_annotation is inspect.Parameter.empty:
                 return resolved_response
             else:
-                return pydantic.parse_obj_as(return_annotation, resolved_response)
+                return utils.parse_obj_as(return_annotation, resolved_response)
 
         if return_annotation is inspect.Parameter.empty:
             try:
@@ -144,12 +152,16 @@ class Operation(Generic[PS, RT_co]):
         ):
             return return_annotation.parse_obj(response.json())
 
-        return pydantic.parse_raw_as(return_annotation, response.text)
+        # Parse the decoded JSON using a (cached) parsing model for the return
+        # annotation, rather than having pydantic decode the response text.
+        return utils.parse_obj_as(return_annotation, response.json())
 
     @property
     def wrapper(self) -> Callable[PS, RT_co]:
         @functools.wraps(self.func)
         def wrapper(*args: PS.args, **kwargs: PS.kwargs) -> RT_co:
+            # NOTE: This is checked on every call, as `self.func` is replaced
+            # with the bound method once a service has been initialised.
             if inspect.ismethod(self.func):
                 # Read off `self` or `cls`
                 _, *args = args  # type: ignore
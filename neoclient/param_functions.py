@@ -1,4 +1,4 @@
-from typing import Any, Callable, Optional, Sequence, TypeVar
+from typing import Any, Callable, Optional, TypeVar
 
 from pydantic.fields import Undefined
 
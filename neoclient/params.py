@@ -1,3 +1,4 @@
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import (
@@ -9,26 +10,23 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Tuple,
     TypeVar,
     Union,
 )
 
-import fastapi.encoders
 import httpx
 from httpx import Cookies, Headers, QueryParams
 from pydantic import Required
 from pydantic.fields import FieldInfo, ModelField, Undefined
 
 from .consumers import (
-    CookieConsumer,
     CookiesConsumer,
-    HeaderConsumer,
     HeadersConsumer,
-    PathConsumer,
     PathParamsConsumer,
-    QueryConsumer,
     QueryParamsConsumer,
-    StateConsumer,
+    apply_header,
+    apply_query_param,
 )
 from .converters import (
     convert_cookie,
@@ -50,8 +48,8 @@ from .resolvers import (
     StateResolver,
 )
 from .types import CookiesTypes, HeadersTypes, PathParamsTypes, QueryParamsTypes
-from .typing import RequestConsumer, RequestResolver, ResponseResolver, Supplier
-from .utils import parse_obj_as
+from .typing import RequestResolver, ResponseResolver, Supplier
+from .utils import Parser, is_str, jsonable_encoder
 
 __all__ = (
     "QueryParameter",
@@ -75,6 +73,35 @@ __all__ = (
 
 K = TypeVar("K")
 V = TypeVar("V")
+T = TypeVar("T")
+
+# These resolvers are stateless, so are shared rather than created each time a
+# parameter is resolved.
+QUERY_PARAMS_RESOLVER: QueryParamsResolver = QueryParamsResolver()
+HEADERS_RESOLVER: HeadersResolver = HeadersResolver()
+COOKIES_RESOLVER: CookiesResolver = CookiesResolver()
+BODY_RESOLVER: BodyResolver = BodyResolver()
+
+# Likewise, the parsers are shared so that their parsing models are only
+# looked up once.
+QUERY_PARAMS_PARSER: Parser[QueryParamsTypes] = Parser(QueryParamsTypes)
+HEADERS_PARSER: Parser[HeadersTypes] = Parser(HeadersTypes)
+COOKIES_PARSER: Parser[CookiesTypes] = Parser(CookiesTypes)
+PATH_PARAMS_PARSER: Parser[PathParamsTypes] = Parser(PathParamsTypes)
+
+
+def _parse_mapping(parser: Parser[T], value: Any, /, *native_types: type) -> T:
+    # Pydantic returns instances of the native types (e.g. `httpx.Headers`)
+    # as-is, and returns an equal copy of a dict of strings, so both are used
+    # directly rather than being validated. Subclasses are validated as usual,
+    # so exact types are checked here.
+    if type(value) in native_types or (
+        type(value) is dict  # pylint: disable=unidiomatic-typecheck
+        and all(is_str(key) and is_str(item) for key, item in value.items())
+    ):
+        return value
+
+    return parser(value)
 
 
 @dataclass(unsafe_hash=True)
@@ -117,8 +144,11 @@ class Parameter(FieldInfo):
         # Pydantic validates that the alias is a "strict" string. This means
         # that enums (e.g. `HeaderName`) are unable to be used.
         # To mitigate this, the alias is explicity converted to a string here.
+        # The alias is also interned, as it is used as a key on every request.
         if self.alias is not None:
-            self.alias = str(self.alias)
+            alias: str = self.alias if is_str(self.alias) else str(self.alias)
+
+            self.alias = sys.intern(alias)
 
     def compose(self, request: RequestOpts, argument: Any, /) -> None:
         raise CompositionError(f"Parameter {type(self)!r} is not composable")
@@ -135,10 +165,35 @@ class Parameter(FieldInfo):
 
     def prepare(self, model_field: ModelField, /) -> None:
         if self.alias is None:
+            # Unlike an explicit alias (see `__post_init__`), this needs no
+            # interning: field names are identifiers, which are already interned.
             self.alias = model_field.name
 
 
-class ComposableSingletonParameter(ABC, Parameter, Generic[K, V]):
+class SingletonParameter(ABC, Parameter, Generic[K]):
+    def _get_key(self, alias: str, /) -> K:
+        # The key is derived from the alias, so it is only parsed once, and is
+        # reused for as long as the alias it was parsed from is unchanged.
+        cached: Optional[Tuple[str, K]] = self.__dict__.get("_key")
+
+        if cached is None or cached[0] is not alias:
+            cached = self.__dict__["_key"] = (alias, self.parse_key(alias))
+
+        return cached[1]
+
+    @abstractmethod
+    def parse_key(self, key: str, /) -> K: ...
+
+    def prepare(self, model_field: ModelField, /) -> None:
+        super().prepare(model_field)
+
+        # Parse the key now that the alias is known, so that this happens when
+        # the parameter is prepared rather than on the first request.
+        if self.alias is not None:
+            self._get_key(self.alias)
+
+
+class ComposableSingletonParameter(SingletonParameter[K], Generic[K, V]):
     def compose(self, request: RequestOpts, argument: Any, /) -> None:
         if self.alias is None:
             raise CompositionError(
@@ -150,35 +205,53 @@ class ComposableSingletonParameter(ABC, Parameter, Generic[K, V]):
         if argument is None and self.default is not Required:
             return
 
-        consumer: RequestConsumer = self.build_consumer(
-            self.parse_key(self.alias),
-            self.parse_value(argument),
-        )
-
-        consumer(request)
-
-    @abstractmethod
-    def parse_key(self, key: str, /) -> K: ...
+        # The value is consumed straight into the request, rather than through
+        # a single-use consumer
+        self.consume(request, self._get_key(self.alias), self.parse_value(argument))
 
     @abstractmethod
     def parse_value(self, value: Any, /) -> V: ...
 
     @abstractmethod
-    def build_consumer(self, key: K, value: V) -> RequestConsumer: ...
+    def consume(self, request: RequestOpts, key: K, value: V, /) -> None: ...
+
+
+class ResolvableSingletonParameter(SingletonParameter[K], Generic[K, V]):
+    # Like the key, the resolvers only depend on the alias, so are only built
+    # once for each alias rather than on every resolution.
+    def _get_request_resolver(self, alias: str, /) -> RequestResolver[V]:
+        cached: Optional[Tuple[str, RequestResolver[V]]] = self.__dict__.get(
+            "_request_resolver"
+        )
+
+        if cached is None or cached[0] is not alias:
+            cached = self.__dict__["_request_resolver"] = (
+                alias,
+                self.build_request_resolver(self._get_key(alias)),
+            )
 
+        return cached[1]
+
+    def _get_response_resolver(self, alias: str, /) -> ResponseResolver[V]:
+        cached: Optional[Tuple[str, ResponseResolver[V]]] = self.__dict__.get(
+            "_response_resolver"
+        )
+
+        if cached is None or cached[0] is not alias:
+            cached = self.__dict__["_response_resolver"] = (
+                alias,
+                self.build_response_resolver(self._get_key(alias)),
+            )
+
+        return cached[1]
 
-class ResolvableSingletonParameter(ABC, Parameter, Generic[K, V]):
     def resolve_request(self, request: RequestOpts, /) -> V:
         if self.alias is None:
             raise ResolutionError(
                 f"Cannot resolve parameter {type(self)!r} without an alias"
             )
 
-        resolver: RequestResolver[V] = self.build_request_resolver(
-            self.parse_key(self.alias),
-        )
-
-        return resolver(request)
+        return self._get_request_resolver(self.alias)(request)
 
     def resolve_response(self, response: Response, /) -> V:
         if self.alias is None:
@@ -186,14 +259,7 @@ class ResolvableSingletonParameter(ABC, Parameter, Generic[K, V]):
                 f"Cannot resolve parameter {type(self)!r} without an alias"
             )
 
-        resolver: ResponseResolver[V] = self.build_response_resolver(
-            self.parse_key(self.alias),
-        )
-
-        return resolver(response)
-
-    @abstractmethod
-    def parse_key(self, key: str, /) -> K: ...
+        return self._get_response_resolver(self.alias)(response)
 
     @abstractmethod
     def build_request_resolver(self, key: K) -> RequestResolver[V]: ...
@@ -215,17 +281,24 @@ class ResolvableSingletonStringParameter(
 
 
 class QueryParameter(
-    ComposableSingletonParameter[str, Sequence[str]],
+    ComposableSingletonParameter[str, Union[str, Sequence[str]]],
     ResolvableSingletonParameter[str, Optional[Sequence[str]]],
 ):
     def parse_key(self, key: str, /) -> str:
         return key
 
-    def parse_value(self, value: Any, /) -> Sequence[str]:
+    def parse_value(self, value: Any, /) -> Union[str, Sequence[str]]:
+        # Strings are passed through as-is, rather than being wrapped in a
+        # single-item list
+        if is_str(value):
+            return value
+
         return convert_query_param(value)
 
-    def build_consumer(self, key: str, value: Sequence[str]) -> RequestConsumer:
-        return QueryConsumer(key, value).consume_request
+    def consume(
+        self, request: RequestOpts, key: str, value: Union[str, Sequence[str]], /
+    ) -> None:
+        request.params = apply_query_param(request.params, key, value)
 
     def build_request_resolver(
         self, key: str
@@ -240,22 +313,33 @@ class QueryParameter(
 
 @dataclass(unsafe_hash=True)
 class HeaderParameter(
-    ComposableSingletonParameter[str, Sequence[str]],
+    ComposableSingletonParameter[str, Union[str, Sequence[str]]],
     ResolvableSingletonParameter[str, Optional[Sequence[str]]],
 ):
     convert_underscores: bool = True
 
     def parse_key(self, key: str, /) -> str:
-        if self.convert_underscores:
-            return key.replace("_", "-")
+        # Keys that are already dashed (e.g. "Content-Type") are left as-is,
+        # rather than being copied by `str.replace`.
+        if self.convert_underscores and "_" in key:
+            # The converted key is a new string, so is (re-)interned like the
+            # alias it is derived from.
+            return sys.intern(key.replace("_", "-"))
 
         return key
 
-    def parse_value(self, value: Any, /) -> Sequence[str]:
+    def parse_value(self, value: Any, /) -> Union[str, Sequence[str]]:
+        # Strings are passed through as-is, rather than being wrapped in a
+        # single-item list
+        if is_str(value):
+            return value
+
         return convert_header(value)
 
-    def build_consumer(self, key: str, value: Sequence[str]) -> RequestConsumer:
-        return HeaderConsumer(key, value).consume_request
+    def consume(
+        self, request: RequestOpts, key: str, value: Union[str, Sequence[str]], /
+    ) -> None:
+        apply_header(request.headers, key, value)
 
     def build_request_resolver(
         self, key: str
@@ -274,8 +358,8 @@ class CookieParameter(
     def parse_value(self, value: Any, /) -> str:
         return convert_cookie(value)
 
-    def build_consumer(self, key: str, value: str) -> RequestConsumer:
-        return CookieConsumer(key, value).consume_request
+    def consume(self, request: RequestOpts, key: str, value: str, /) -> None:
+        request.cookies[key] = value
 
     def build_request_resolver(self, key: str) -> RequestResolver[Optional[str]]:
         return CookieResolver(key).resolve_request
@@ -291,47 +375,49 @@ class PathParameter(ComposableSingletonStringParameter):
     def parse_value(self, value: Any, /) -> str:
         return convert_path_param(value, delimiter=self.delimiter)
 
-    def build_consumer(self, key: str, value: str) -> RequestConsumer:
-        return PathConsumer(key, value).consume_request
+    def consume(self, request: RequestOpts, key: str, value: str, /) -> None:
+        request.path_params[key] = value
 
 
 class QueryParamsParameter(Parameter):
     def compose(self, request: RequestOpts, argument: Any, /) -> None:
-        params: QueryParamsTypes = parse_obj_as(QueryParamsTypes, argument)  # type: ignore
+        params: QueryParamsTypes = _parse_mapping(
+            QUERY_PARAMS_PARSER, argument, QueryParams
+        )
 
         QueryParamsConsumer(params).consume_request(request)
 
     def resolve_request(self, request: RequestOpts, /) -> QueryParams:
-        return QueryParamsResolver().resolve_request(request)
+        return QUERY_PARAMS_RESOLVER.resolve_request(request)
 
     def resolve_response(self, response: Response, /) -> QueryParams:
-        return QueryParamsResolver().resolve_response(response)
+        return QUERY_PARAMS_RESOLVER.resolve_response(response)
 
 
 class HeadersParameter(Parameter):
     def compose(self, request: RequestOpts, argument: Any, /) -> None:
-        headers: HeadersTypes = parse_obj_as(HeadersTypes, argument)  # type: ignore
+        headers: HeadersTypes = _parse_mapping(HEADERS_PARSER, argument, Headers)
 
         HeadersConsumer(headers).consume_request(request)
 
     def resolve_request(self, request: RequestOpts, /) -> Headers:
-        return HeadersResolver().resolve_request(request)
+        return HEADERS_RESOLVER.resolve_request(request)
 
     def resolve_response(self, response: Response, /) -> Headers:
-        return HeadersResolver().resolve_response(response)
+        return HEADERS_RESOLVER.resolve_response(response)
 
 
 class CookiesParameter(Parameter):
     def compose(self, request: RequestOpts, argument: Any, /) -> None:
-        cookies: CookiesTypes = parse_obj_as(CookiesTypes, argument)  # type: ignore
+        cookies: CookiesTypes = _parse_mapping(COOKIES_PARSER, argument, Cookies)
 
         CookiesConsumer(cookies).consume_request(request)
 
     def resolve_request(self, request: RequestOpts, /) -> Cookies:
-        return CookiesResolver().resolve_request(request)
+        return COOKIES_RESOLVER.resolve_request(request)
 
     def resolve_response(self, response: Response, /) -> Cookies:
-        return CookiesResolver().resolve_response(response)
+        return COOKIES_RESOLVER.resolve_response(response)
 
 
 @dataclass(unsafe_hash=True)
@@ -339,7 +425,7 @@ class PathParamsParameter(Parameter):
     delimiter: str = "/"
 
     def compose(self, request: RequestOpts, argument: Any, /) -> None:
-        raw_path_params: PathParamsTypes = parse_obj_as(PathParamsTypes, argument)  # type: ignore
+        raw_path_params: PathParamsTypes = _parse_mapping(PATH_PARAMS_PARSER, argument)
 
         path_params: Mapping[str, str] = convert_path_params(
             raw_path_params, delimiter=self.delimiter
@@ -360,28 +446,28 @@ class BodyParameter(Parameter):
         if argument is None and self.default is not Required:
             return
 
-        json_value: Any = fastapi.encoders.jsonable_encoder(argument)
-
-        if self.embed:
-            if self.alias is None:
-                raise CompositionError(
-                    f"Cannot embed parameter {type(self)!r} without an alias"
-                )
-
-            json_value = {self.alias: json_value}
+        json_value: Any = jsonable_encoder(argument)
 
         # If this parameter shouln't be embedded in any pre-existing json,
         # make it the entire JSON request body
         if not self.embed:
             request.json = json_value
+            return
+
+        alias: Optional[str] = self.alias
+
+        if alias is None:
+            raise CompositionError(
+                f"Cannot embed parameter {type(self)!r} without an alias"
+            )
+
+        if request.json is None:
+            request.json = {alias: json_value}
         else:
-            if request.json is None:
-                request.json = json_value
-            else:
-                request.json.update(json_value)
+            request.json[alias] = json_value
 
     def resolve_response(self, response: Response, /) -> Any:
-        return BodyResolver()(response)
+        return BODY_RESOLVER(response)
 
 
 class URLParameter(Parameter):
@@ -419,8 +505,8 @@ class StateParameter(
     def parse_value(self, value: Any, /) -> Any:
         return value
 
-    def build_consumer(self, key: str, value: Any) -> RequestConsumer:
-        return StateConsumer(key, value).consume_request
+    def consume(self, request: RequestOpts, key: str, value: Any, /) -> None:
+        request.state[key] = value
 
     def build_request_resolver(self, key: str) -> RequestResolver[Any]:
         return StateResolver(key).resolve_request
@@ -1,16 +1,19 @@
 from typing import Any, Callable
 
-from .dependence import DependencyParameter
+from .dependence import DependencyResolver
 from .models import RequestOpts, Response
 
 
 def resolve_response(func: Callable, response: Response) -> Any:
-    dependency: DependencyParameter = DependencyParameter(dependency=func)
+    # Resolved with a `DependencyResolver` directly, as wrapping it in a
+    # `DependencyParameter` first would only add an extra allocation.
+    resolver: DependencyResolver = DependencyResolver(func)
 
-    return dependency.resolve_response(response)
+    return resolver.resolve(response)
 
 
 def resolve_request(func: Callable, request: RequestOpts) -> Any:
-    dependency: DependencyParameter = DependencyParameter(dependency=func)
+    # Resolved the same way as a response (see `resolve_response`)
+    resolver: DependencyResolver = DependencyResolver(func)
 
-    return dependency.resolve_request(request)
+    return resolver.resolve(request)
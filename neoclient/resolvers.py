@@ -22,6 +22,8 @@ T = TypeVar("T")
 
 @dataclass
 class QueryResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ("name",)
+
     name: str
 
     def resolve_request(self, request: RequestOpts, /) -> Optional[Sequence[str]]:
@@ -39,6 +41,8 @@ class QueryResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 @dataclass
 class HeaderResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ("name",)
+
     name: str
 
     def resolve_request(self, request: RequestOpts, /) -> Optional[Sequence[str]]:
@@ -56,6 +60,8 @@ class HeaderResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 @dataclass
 class CookieResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ("name",)
+
     name: str
 
     def resolve_request(self, request: RequestOpts, /) -> Optional[str]:
@@ -69,6 +75,8 @@ class CookieResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 
 class QueryParamsResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ()
+
     @staticmethod
     def resolve_request(request: RequestOpts, /) -> QueryParams:
         return request.params
@@ -79,6 +87,8 @@ class QueryParamsResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 
 class HeadersResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ()
+
     @staticmethod
     def resolve_request(request: RequestOpts, /) -> Headers:
         return request.headers
@@ -89,6 +99,8 @@ class HeadersResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 
 class CookiesResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ()
+
     @staticmethod
     def resolve_request(request: RequestOpts, /) -> Cookies:
         return request.cookies
@@ -99,6 +111,8 @@ class CookiesResolver(SupportsResolveRequest, SupportsResolveResponse):
 
 
 class BodyResolver(ResponseResolver[Any]):
+    __slots__ = ()
+
     @staticmethod
     def __call__(response: Response, /) -> Any:
         return response.json()
@@ -106,6 +120,8 @@ class BodyResolver(ResponseResolver[Any]):
 
 @dataclass
 class StateResolver(SupportsResolveRequest, SupportsResolveResponse):
+    __slots__ = ("key",)
+
     key: str
 
     def resolve_request(self, request: RequestOpts, /) -> Any:
@@ -23,24 +23,28 @@ class ServiceMeta(type):
         mcs: Type["ServiceMeta"], name: str, bases: Tuple[type], attrs: Dict[str, Any]
     ) -> type:
         def __init__(self) -> None:
+            # Inspecting the members of the service looks up (and binds) every
+            # attribute, so is only done once for all of the passes below.
+            members: Sequence[Tuple[str, Any]] = inspect.getmembers(self)
+
             service_middleware: Sequence[MiddlewareCallable[Request, Response]] = [
                 member
-                for _, member in inspect.getmembers(self)
+                for _, member in members
                 if has_annotation(member, Entity.MIDDLEWARE)
             ]
             service_responses: Sequence[Dependency] = [
                 member
-                for _, member in inspect.getmembers(self)
+                for _, member in members
                 if has_annotation(member, Entity.RESPONSE)
             ]
             service_request_dependencies: Sequence[Dependency] = [
                 member
-                for _, member in inspect.getmembers(self)
+                for _, member in members
                 if has_annotation(member, Entity.REQUEST_DEPENDENCY)
             ]
             service_response_dependencies: Sequence[Dependency] = [
                 member
-                for _, member in inspect.getmembers(self)
+                for _, member in members
                 if has_annotation(member, Entity.RESPONSE_DEPENDENCY)
             ]
 
@@ -79,7 +83,9 @@ class ServiceMeta(type):
                 response_dependencies=response_dependencies,
             )
 
-            for member_name, member in inspect.getmembers(self):
+            member_name: str
+            member: Any
+            for member_name, member in members:
                 if not has_operation(member):
                     continue
 
@@ -1,9 +1,15 @@
+import collections.abc
+import dataclasses
+import functools
 import inspect
 import string
 import typing
+from types import MethodType
 from typing import (
     Any,
     Callable,
+    FrozenSet,
+    Generic,
     Mapping,
     MutableMapping,
     MutableSequence,
@@ -18,34 +24,50 @@ from httpx import Headers, QueryParams
 from pydantic import BaseConfig, BaseModel, create_model
 from pydantic.fields import FieldInfo, Undefined
 from pydantic.typing import display_as_type
+from typing_extensions import TypeGuard
 
 __all__ = (
     "parse_format_string",
-    "bind_arguments",
+    "get_cache_key",
+    "get_signature",
     "is_primitive",
+    "is_str",
     "unpack_arguments",
     "get_default",
     "has_default",
     "parse_obj_as",
+    "Parser",
     "is_generic_alias",
+    "is_body_annotation",
+    "jsonable_encoder",
 )
 
 T = TypeVar("T")
 
+FORMATTER: string.Formatter = string.Formatter()
 
-def parse_format_string(format_string: str, /) -> Set[str]:
+JSON_PRIMITIVE_TYPES: FrozenSet[type] = frozenset((str, int, float, bool, type(None)))
+JSON_TYPES: FrozenSet[type] = JSON_PRIMITIVE_TYPES | {dict, list}
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_format_string(format_string: str, /) -> FrozenSet[str]:
     """
     Extracts a set of field names from `format_string`
 
     Example:
         >>> parse_format_string("foo {bar}")
-        {"bar"}
+        frozenset({"bar"})
     """
 
+    # Fast path: a string without any braces has no fields to parse
+    if "{" not in format_string and "}" not in format_string:
+        return frozenset()
+
     path_params: Set[str] = set()
 
     field_name: Optional[str]
-    for _, field_name, _, _ in string.Formatter().parse(format_string):
+    for _, field_name, _, _ in FORMATTER.parse(format_string):
         if field_name is None:
             continue
 
@@ -54,51 +76,141 @@ def parse_format_string(format_string: str, /) -> Set[str]:
 
         path_params.add(field_name)
 
-    return path_params
+    return frozenset(path_params)
+
+
+# What bound methods are re-bound to when used as cache keys
+UNBOUND: Any = object()
+
+
+def _unwrap(func: Callable, /) -> Callable:
+    # Wrappers are followed the same way `inspect.signature` follows them
+    return inspect.unwrap(func, stop=lambda func: hasattr(func, "__signature__"))
+
+
+def get_cache_key(func: Callable, /) -> Callable:
+    """
+    Returns the function to use in place of `func` when caching by function
+
+    Anything cached by function only depends on the function's signature.
+    A wrapper (e.g. from `functools.wraps`) has the same signature as the
+    function it wraps, and a bound method has the same signature whatever it
+    is bound to. So the wrapped function is used instead, and bound methods
+    are re-bound to a placeholder. This way, every instance of a class (e.g.
+    a `Service`) shares the same cache entries, and the caches don't keep
+    any of them alive.
+    """
+
+    # Bound methods are checked first, as unwrapping one directly would unwrap
+    # the function it's bound to (losing the binding).
+    if not isinstance(func, MethodType):
+        func = _unwrap(func)
+
+    if isinstance(func, MethodType):
+        return MethodType(_unwrap(func.__func__), UNBOUND)
+
+    return func
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_cached_signature(func: Callable, /) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def get_signature(func: Callable, /) -> inspect.Signature:
+    # Signatures are immutable, and inspecting a function is expensive, so the
+    # signature of each function is cached where possible.
+    key: Callable = get_cache_key(func)
+
+    try:
+        hash(key)
+    except TypeError:
+        return inspect.signature(func)
+
+    return _get_cached_signature(key)
 
 
-def bind_arguments(
-    func: Callable, /, args: Tuple[Any, ...], kwargs: Mapping[str, Any]
-) -> Mapping[str, Any]:
-    bound_arguments: inspect.BoundArguments = inspect.signature(func).bind(
-        *args, **kwargs
+# The name, kind and default of a parameter, as plain values, so that they
+# aren't looked up through `inspect.Parameter`'s properties on every call.
+ParameterSpec = Tuple[str, inspect._ParameterKind, Any]
+
+# Parameter kinds that collect any remaining arguments (e.g. `*args`, `**kwargs`)
+VARIADIC_PARAMETER_KINDS: FrozenSet[inspect._ParameterKind] = frozenset(
+    (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class SignatureSpec:
+    parameters: Tuple[ParameterSpec, ...]
+    is_variadic: bool
+
+
+def _get_signature_spec(func: Callable, /) -> SignatureSpec:
+    parameters: Tuple[ParameterSpec, ...] = tuple(
+        (parameter.name, parameter.kind, parameter.default)
+        for parameter in get_signature(func).parameters.values()
+    )
+
+    return SignatureSpec(
+        parameters=parameters,
+        is_variadic=any(kind in VARIADIC_PARAMETER_KINDS for _, kind, _ in parameters),
     )
 
-    bound_arguments.apply_defaults()
 
-    return bound_arguments.arguments
+@functools.lru_cache(maxsize=1024)
+def _get_cached_signature_spec(func: Callable, /) -> SignatureSpec:
+    return _get_signature_spec(func)
+
+
+def get_signature_spec(func: Callable, /) -> SignatureSpec:
+    key: Callable = get_cache_key(func)
+
+    try:
+        hash(key)
+    except TypeError:
+        return _get_signature_spec(func)
+
+    return _get_cached_signature_spec(key)
 
 
 def is_primitive(obj: Any, /) -> bool:
     return isinstance(obj, (str, int, float, bool, type(None)))
 
 
+def is_str(obj: Any, /) -> TypeGuard[str]:
+    # Only exact strings can be used as-is: `str` subclasses (e.g. enums) are
+    # still converted, so the exact-type check is deliberate here.
+    return type(obj) is str  # pylint: disable=unidiomatic-typecheck
+
+
 def unpack_arguments(
     func: Callable, arguments: Mapping[str, Any]
 ) -> Tuple[Tuple[Any, ...], Mapping[str, Any]]:
-    parameters: Mapping[str, inspect.Parameter] = inspect.signature(func).parameters
+    parameters: Tuple[ParameterSpec, ...] = get_signature_spec(func).parameters
 
     args: MutableSequence[Any] = []
     kwargs: MutableMapping[str, Any] = {}
 
-    parameter: inspect.Parameter
-    for parameter in parameters.values():
-        if parameter.name not in arguments:
-            raise ValueError(f"Missing argument for parameter {parameter.name!r}")
+    name: str
+    kind: inspect._ParameterKind
+    for name, kind, _ in parameters:
+        if name not in arguments:
+            raise ValueError(f"Missing argument for parameter {name!r}")
 
-        argument: Any = arguments[parameter.name]
+        argument: Any = arguments[name]
 
-        if parameter.kind == inspect.Parameter.POSITIONAL_ONLY:
+        if kind is inspect.Parameter.POSITIONAL_ONLY:
             args.append(argument)
-        elif parameter.kind in (
-            inspect.Parameter.POSITIONAL_OR_KEYWORD,
-            inspect.Parameter.KEYWORD_ONLY,
+        elif (
+            kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+            or kind is inspect.Parameter.KEYWORD_ONLY
         ):
-            kwargs[parameter.name] = argument
-        elif parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            kwargs[name] = argument
+        elif kind is inspect.Parameter.VAR_POSITIONAL:
             args.extend(argument)
         else:
-            assert parameter.kind == inspect.Parameter.VAR_KEYWORD
+            assert kind is inspect.Parameter.VAR_KEYWORD
 
             kwargs.update(argument)
 
@@ -116,38 +228,158 @@ def has_default(field_info: FieldInfo, /) -> bool:
     return field_info.default is not Undefined or field_info.default_factory is not None
 
 
-def parse_obj_as(type_: Type[T], obj: Any) -> T:
+def _create_parsing_model(type_: Any, /) -> Type[BaseModel]:
     parsing_type_name: str = f"ParsingModel[{display_as_type(type_)}]"
 
     class Config(BaseConfig):
         arbitrary_types_allowed: bool = True
 
-    model_cls: Type[BaseModel] = create_model(
+    return create_model(
         parsing_type_name,
         __config__=Config,
         __root__=(type_, ...),
     )
 
+
+@functools.lru_cache(maxsize=512)
+def _get_cached_parsing_model(type_: Any, /) -> Type[BaseModel]:
+    return _create_parsing_model(type_)
+
+
+def _get_parsing_model(type_: Any, /) -> Type[BaseModel]:
+    # Building a parsing model is expensive, and the same types are parsed
+    # repeatedly (e.g. once per request), so models are cached by type where
+    # possible. Unhashable types fall back to building a fresh model.
+    # NOTE: This is called on every request, and hashing a type (e.g. a large
+    # `Union`) is not free, so the type is only hashed once, by the cache
+    # itself, rather than being checked for hashability upfront.
+    try:
+        return _get_cached_parsing_model(type_)
+    except TypeError:
+        return _create_parsing_model(type_)
+
+
+def parse_obj_as(type_: Type[T], obj: Any) -> T:
+    # Fast path: nothing can fail to parse as `Any`, and a JSON type (e.g. a
+    # decoded response body) parsed as its own exact type is returned as-is,
+    # exactly as pydantic would return it. Subclasses are still parsed, so the
+    # exact-type check is deliberate.
+    # pylint: disable-next=unidiomatic-typecheck
+    if type_ is Any or (type(obj) is type_ and type_ in JSON_TYPES):
+        return obj
+
+    model_cls: Type[BaseModel] = _get_parsing_model(type_)
+
     model: BaseModel = model_cls(__root__=obj)
 
     return getattr(model, "__root__")
 
 
+@dataclasses.dataclass
+class Parser(Generic[T]):
+    """
+    Parses objects as a fixed type, like `parse_obj_as`
+
+    The parsing model is looked up on first use and then kept, so the type
+    (e.g. a large `Union`) is not hashed again on every parse.
+    """
+
+    type_: Any
+
+    @functools.cached_property
+    def model_cls(self) -> Type[BaseModel]:
+        return _get_parsing_model(self.type_)
+
+    def __call__(self, obj: Any, /) -> T:
+        model: BaseModel = self.model_cls(__root__=obj)
+
+        return getattr(model, "__root__")
+
+
 def is_generic_alias(type_: Type, /) -> bool:
     return typing.get_origin(type_) is not None
 
 
+def is_body_annotation(annotation: Any, /) -> bool:
+    # The same annotations are classified repeatedly (once for each function
+    # and set of path params), so the result is cached where possible.
+    try:
+        hash(annotation)
+    except TypeError:
+        return _check_body_annotation(annotation)
+
+    return _check_cached_body_annotation(annotation)
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_cached_body_annotation(annotation: Any, /) -> bool:
+    return _check_body_annotation(annotation)
+
+
+def _check_body_annotation(annotation: Any, /) -> bool:
+    return (
+        (isinstance(annotation, type) and issubclass(annotation, (BaseModel, dict)))
+        or dataclasses.is_dataclass(annotation)
+        or (
+            is_generic_alias(annotation)
+            and typing.get_origin(annotation) in (collections.abc.Mapping,)
+        )
+    )
+
+
+class _NotJsonNative(Exception):
+    pass
+
+
+def _copy_json_native(obj: Any, /) -> Any:
+    obj_type: type = type(obj)
+
+    if obj_type in JSON_PRIMITIVE_TYPES:
+        return obj
+    if obj_type is dict:
+        key: Any
+        for key in obj:
+            # NOTE: fastapi's encoder drops keys prefixed with "_sa" (SQLAlchemy
+            # internals), so those bodies are left for it to encode.
+            if not is_str(key) or key.startswith("_sa"):
+                raise _NotJsonNative
+
+        return {key: _copy_json_native(value) for key, value in obj.items()}
+    if obj_type is list or obj_type is tuple:
+        # Tuples are encoded as lists, exactly as fastapi's encoder does
+        return [_copy_json_native(value) for value in obj]
+
+    raise _NotJsonNative
+
+
+def jsonable_encoder(obj: Any, /) -> Any:
+    # Fast path: values made up entirely of JSON-native types (e.g. str, int,
+    # dict, list) don't need to go through fastapi's encoder. Containers are
+    # still copied so the caller's objects are never mutated.
+    try:
+        return _copy_json_native(obj)
+    except _NotJsonNative:
+        pass
+
+    # NOTE: Importing fastapi pulls in starlette and much of its application
+    # machinery, so it is deferred until a body actually needs encoding.
+    # fastapi is also only in the optional "examples" dependency group.
+    import fastapi.encoders  # pylint: disable=import-outside-toplevel
+
+    return fastapi.encoders.jsonable_encoder(obj)
+
+
 # WARN: Currently unused
 def merge_headers(lhs: Headers, rhs: Headers, /, *, overwrite: bool = True) -> Headers:
     if overwrite:
-        headers: Headers = lhs.copy()
-
-        key: str
-        for key in rhs:
-            if key in headers:
-                del headers[key]
-
-        return merge_headers(headers, rhs, overwrite=False)
+        # Drop any headers from `lhs` that are present in `rhs` while building
+        # the merged headers, rather than copying `lhs` and deleting them
+        return Headers(
+            (
+                *((key, value) for key, value in lhs.multi_items() if key not in rhs),
+                *rhs.multi_items(),
+            )
+        )
     else:
         # Keep all headers from both
         return Headers((*lhs.multi_items(), *rhs.multi_items()))
@@ -158,14 +390,14 @@ def merge_query_params(
     lhs: QueryParams, rhs: QueryParams, /, *, overwrite: bool = True
 ) -> QueryParams:
     if overwrite:
-        params: QueryParams = lhs
-
-        key: str
-        for key in rhs:
-            if key in params:
-                params = params.remove(key)
-
-        return merge_query_params(params, rhs, overwrite=False)
+        # Drop any query params from `lhs` that are present in `rhs` while
+        # building the merged params, rather than removing them one at a time
+        return QueryParams(
+            (
+                *((key, value) for key, value in lhs.multi_items() if key not in rhs),
+                *rhs.multi_items(),
+            )
+        )
     else:
         # Keep all query params from both
         return QueryParams((*lhs.multi_items(), *rhs.multi_items()))
@@ -187,11 +419,6 @@ def add_headers(lhs: Headers, rhs: Headers, /) -> None:
 
 def add_params(lhs: QueryParams, rhs: QueryParams, /) -> QueryParams:
     """Return a new QueryParams instance, appending the params from `lhs` and `rhs`"""
-    params: QueryParams = lhs
-
-    key: str
-    value: str
-    for key, value in rhs.multi_items():
-        params = params.add(key, value)
-
-    return params
+    # Build the params in one go, rather than calling `QueryParams.add` (which
+    # copies the params) once for each value
+    return QueryParams((*lhs.multi_items(), *rhs.multi_items()))
@@ -1,6 +1,7 @@
 import inspect
-from functools import cached_property, wraps
+from functools import cached_property, lru_cache, wraps
 from inspect import Parameter, Signature, signature
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
@@ -68,32 +69,53 @@ def validate(
     return decorate
 
 
+@lru_cache(maxsize=None)
+def _get_config_members(config: Type[Any], /) -> Mapping[str, Any]:
+    # Inspecting the members of a class is expensive, and the same config
+    # classes are used repeatedly, so the members are only read once.
+    configurations: Dict[str, Any] = {}
+
+    member_name: str
+    member: Any
+    for member_name, member in inspect.getmembers(config):
+        if member_name.startswith("_"):
+            continue
+
+        configurations[member_name] = member
+
+    return MappingProxyType(configurations)
+
+
+def _create_base_model_cls(configurations: Mapping[str, Any], /) -> Type[BaseModel]:
+    Config: Type[Any] = type("Config", (), {"extra": Extra.forbid, **configurations})
+
+    return type("ValidatedFunctionBaseModel", (BaseModel,), {"Config": Config})
+
+
+@lru_cache(maxsize=None)
+def _get_base_model_cls(config: Optional[Type[Any]], /) -> Type[BaseModel]:
+    # Config classes are reused between functions, so each function's model
+    # can share the same base model, rather than creating a new one each time.
+    if config is None:
+        return _create_base_model_cls({})
+
+    return _create_base_model_cls(_get_config_members(config))  # type: ignore
+
+
 def create_func_model(
     function: Callable,
     fields: Mapping[str, Any],
     *,
     config: Optional[ConfigType] = None,
 ) -> Type[BaseModel]:
-    configurations: Dict[str, Any] = {}
+    ValidatedFunctionBaseModel: Type[BaseModel]
 
     if isinstance(config, dict):
-        configurations.update(config)
+        ValidatedFunctionBaseModel = _create_base_model_cls(config)
     elif isinstance(config, type):
-        member_name: str
-        member: Any
-        for member_name, member in inspect.getmembers(config):
-            if member_name.startswith("_"):
-                continue
-
-            configurations[member_name] = member
-
-    configurations.setdefault("extra", Extra.forbid)
-
-    Config: Type[Any] = type("Config", (), configurations)
-
-    ValidatedFunctionBaseModel: Type[BaseModel] = type(
-        "ValidatedFunctionBaseModel", (BaseModel,), {"Config": Config}
-    )
+        ValidatedFunctionBaseModel = _get_base_model_cls(config)  # type: ignore
+    else:
+        ValidatedFunctionBaseModel = _get_base_model_cls(None)
 
     return create_model(
         to_camel(function.__name__),
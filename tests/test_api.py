@@ -1,5 +1,6 @@
 import pytest
 
+from neoclient import api
 from neoclient.decorators import get
 from neoclient.errors import DuplicateParameters
 from neoclient.param_functions import Query
@@ -19,3 +20,72 @@ def test_get_params_duplicate_implicit():
 
         @get("/foo")
         def foo(param_1: str, param_2: str = Query("param_1")) -> None: ...
+
+
+def test_bind_arguments() -> None:
+    def foo(a: str, /, b: str = Query(), *, c: str = "c") -> None: ...
+
+    assert api.bind_arguments(foo, ("a",), {}) == {"a": "a", "c": "c"}
+    assert api.bind_arguments(foo, ("a", "b"), {"c": "c!"}) == {
+        "a": "a",
+        "b": "b",
+        "c": "c!",
+    }
+
+    with pytest.raises(TypeError):
+        api.bind_arguments(foo, (), {"a": "a"})
+
+    with pytest.raises(TypeError):
+        api.bind_arguments(foo, ("a",), {"d": "d"})
+
+    with pytest.raises(TypeError):
+        api.bind_arguments(foo, ("a", "b", "c"), {})
+
+
+def test_bind_arguments_defaults() -> None:
+    def foo(
+        param_1: str,
+        /,
+        param_2: str = "param_2_default",
+        *,
+        param_3: str = "param_3_default",
+    ): ...
+
+    assert api.bind_arguments(foo, ("param_1",), {}) == {
+        "param_1": "param_1",
+        "param_2": "param_2_default",
+        "param_3": "param_3_default",
+    }
+    assert api.bind_arguments(foo, ("param_1", "param_2"), {}) == {
+        "param_1": "param_1",
+        "param_2": "param_2",
+        "param_3": "param_3_default",
+    }
+    assert api.bind_arguments(foo, ("param_1",), {"param_2": "param_2"}) == {
+        "param_1": "param_1",
+        "param_2": "param_2",
+        "param_3": "param_3_default",
+    }
+    assert api.bind_arguments(foo, ("param_1", "param_2"), {"param_3": "param_3"}) == {
+        "param_1": "param_1",
+        "param_2": "param_2",
+        "param_3": "param_3",
+    }
+    assert api.bind_arguments(
+        foo, ("param_1",), {"param_2": "param_2", "param_3": "param_3"}
+    ) == {
+        "param_1": "param_1",
+        "param_2": "param_2",
+        "param_3": "param_3",
+    }
+
+
+def test_bind_arguments_variadic() -> None:
+    def foo(a: str, *args: str, **kwargs: str) -> None: ...
+
+    assert api.bind_arguments(foo, ("a",), {}) == {"a": "a", "args": (), "kwargs": {}}
+    assert api.bind_arguments(foo, ("a", "b"), {"c": "c"}) == {
+        "a": "a",
+        "args": ("b",),
+        "kwargs": {"c": "c"},
+    }
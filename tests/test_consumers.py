@@ -21,6 +21,8 @@ from neoclient.consumers import (
     QueryParamsConsumer,
     StateConsumer,
     TimeoutConsumer,
+    apply_header,
+    apply_query_param,
 )
 from neoclient.defaults import DEFAULT_FOLLOW_REDIRECTS
 from neoclient.models import RequestOpts, State
@@ -32,6 +34,28 @@ def pre_request() -> RequestOpts:
     return RequestOpts("GET", "/foo")
 
 
+def test_apply_query_param() -> None:
+    params: QueryParams = QueryParams({"name": "sam"})
+
+    assert apply_query_param(params, "name", "bob") == QueryParams({"name": "bob"})
+    assert apply_query_param(params, "name", ["bob"]) == QueryParams({"name": "bob"})
+    assert apply_query_param(params, "name", ["bob", "ted"]) == QueryParams(
+        [("name", "sam"), ("name", "bob"), ("name", "ted")]
+    )
+
+
+def test_apply_header() -> None:
+    headers: Headers = Headers({"name": "sam"})
+
+    apply_header(headers, "name", ["bob"])
+
+    assert headers == Headers({"name": "bob"})
+
+    apply_header(headers, "name", "ted")
+
+    assert headers == Headers({"name": "ted"})
+
+
 def test_consumer_query_param(pre_request: RequestOpts) -> None:
     key: str = "name"
     value: str = "sam"
@@ -217,3 +241,8 @@ def test_FollowRedirectsConsumer(pre_request: RequestOpts) -> None:
     FollowRedirectsConsumer(follow_redirects).consume_request(pre_request)
 
     assert pre_request == expected_pre_request
+
+
+def test_consumer_has_no_instance_dict() -> None:
+    assert not hasattr(QueryConsumer("name", "sam"), "__dict__")
+    assert not hasattr(PathParamsConsumer({"name": "sam"}), "__dict__")
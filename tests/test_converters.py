@@ -109,3 +109,7 @@ def test_convert_timeout() -> None:
     assert converters.convert_timeout(1.25) == Timeout(1.25)
     assert converters.convert_timeout(None) == Timeout(None)
     assert converters.convert_timeout(Timeout(1.5)) == Timeout(1.5)
+
+    timeout: Timeout = Timeout(2.0)
+
+    assert converters.convert_timeout(timeout) is timeout
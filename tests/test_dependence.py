@@ -1,10 +1,17 @@
+from typing import List
+
 import pytest
 from httpx import Headers
 from pydantic import BaseConfig
 from pydantic.fields import ModelField
 
-from neoclient import Cookie
-from neoclient.dependence import DependencyParameter, DependencyResolver, get_fields
+from neoclient import Cookie, Query
+from neoclient.dependence import (
+    DependencyParameter,
+    DependencyResolver,
+    get_fields,
+    solve,
+)
 from neoclient.enums import HTTPMethod
 from neoclient.errors import ResolutionError
 from neoclient.models import RequestOpts, Response
@@ -32,6 +39,41 @@ def test_get_fields() -> None:
     }
 
 
+def test_get_fields_cached() -> None:
+    def foo(query: str) -> None: ...
+
+    assert get_fields(foo) is get_fields(foo)
+
+
+def test_get_fields_infers_subclasses() -> None:
+    class CustomHeaders(Headers): ...
+
+    def foo(headers: CustomHeaders) -> None: ...
+
+    assert get_fields(foo) == {
+        "headers": (CustomHeaders, HeadersParameter(alias="headers")),
+    }
+
+
+def test_solve() -> None:
+    def foo(query: str, queries: List[str] = Query("query")) -> None: ...
+
+    assert solve(foo) is solve(foo)
+    assert [
+        (step.field_name, step.use_first_value, step.has_default)
+        for step in solve(foo).steps
+    ] == [("query", True, False), ("queries", False, False)]
+
+
+def test_solve_pass_through() -> None:
+    def foo(response: Response) -> None: ...
+
+    def bar(response: Response, query: str) -> None: ...
+
+    assert solve(foo).is_pass_through
+    assert not solve(bar).is_pass_through
+
+
 def test_DependencyResolver_resolve_response() -> None:
     def dependency(response: Response, /) -> Response:
         return response
@@ -69,6 +111,26 @@ def test_DependencyParameter_resolve() -> None:
         dependency_parameter_without_dependency.resolve_response(response)
 
 
+def test_DependencyParameter_resolve_dependency_changed() -> None:
+    def dependency_a(response: Response, /) -> str:
+        return "a"
+
+    def dependency_b(response: Response, /) -> str:
+        return "b"
+
+    response: Response = build_response()
+
+    dependency_parameter: DependencyParameter = DependencyParameter(
+        dependency=dependency_a
+    )
+
+    assert dependency_parameter.resolve_response(response) == "a"
+
+    dependency_parameter.dependency = dependency_b
+
+    assert dependency_parameter.resolve_response(response) == "b"
+
+
 def test_DependencyParameter_prepare() -> None:
     def some_dependency(response: Response, /) -> Response:
         return response
@@ -1,6 +1,8 @@
 import pytest
+from httpx import URL, Client, Cookies, Headers, Timeout
 
-from neoclient.models import State
+from neoclient.errors import IncompatiblePathParameters
+from neoclient.models import RequestOpts, State
 
 
 def test_State_init() -> None:
@@ -68,3 +70,77 @@ def test_State_del_item() -> None:
 
     with pytest.raises(KeyError):
         del state["missing"]
+
+
+def test_RequestOpts_copy() -> None:
+    request: RequestOpts = RequestOpts(
+        "GET",
+        "/{id}",
+        params={"name": "sam"},
+        headers={"name": "sam"},
+        cookies={"name": "sam"},
+        path_params={"id": "123"},
+        state=State(name="sam"),
+    )
+
+    request_copy: RequestOpts = request.copy()
+
+    assert request_copy == request
+
+    request_copy.headers["age"] = "43"
+    request_copy.cookies["age"] = "43"
+    request_copy.path_params["age"] = "43"
+    request_copy.state.age = 43
+    request_copy.extensions["age"] = 43
+
+    assert request.headers == Headers({"name": "sam"})
+    assert request.cookies == Cookies({"name": "sam"})
+    assert request.path_params == {"id": "123"}
+    assert request.state == State(name="sam")
+    assert request.extensions == {}
+
+
+def test_RequestOpts_formatted_url() -> None:
+    request: RequestOpts = RequestOpts("GET", "https://foo.com/users")
+
+    assert request.formatted_url is request.url
+
+    request = RequestOpts("GET", "https://foo.com/{id}", path_params={"id": "123"})
+
+    assert request.formatted_url == URL("https://foo.com/123")
+
+    request = RequestOpts(
+        "GET", "https://{region}.foo.com/", path_params={"region": "eu"}
+    )
+
+    assert request.formatted_url == URL("https://eu.foo.com/")
+
+    request = RequestOpts("GET", "https://{region}.foo.com/")
+
+    with pytest.raises(KeyError):
+        request.formatted_url
+
+
+def test_RequestOpts_validate() -> None:
+    RequestOpts("GET", "https://foo.com/users").validate()
+    RequestOpts("GET", "https://foo.com/{id}", path_params={"id": "123"}).validate()
+    RequestOpts(
+        "GET", "https://{region}.foo.com/", path_params={"region": "eu"}
+    ).validate()
+
+    with pytest.raises(IncompatiblePathParameters):
+        RequestOpts("GET", "https://foo.com/{id}").validate()
+
+    with pytest.raises(IncompatiblePathParameters):
+        RequestOpts("GET", "https://{region}.foo.com/").validate()
+
+
+def test_RequestOpts_build_timeout() -> None:
+    client: Client = Client(timeout=5)
+
+    assert RequestOpts("GET", "/").build(client).extensions["timeout"] == (
+        Timeout(None).as_dict()
+    )
+    assert RequestOpts("GET", "/", timeout=2).build(client).extensions["timeout"] == (
+        Timeout(2).as_dict()
+    )
@@ -1,4 +1,5 @@
 import pytest
+from httpx import Headers
 
 from neoclient.errors import ResolutionError
 from neoclient.models import RequestOpts, Response, State
@@ -6,6 +7,8 @@ from neoclient.params import (
     AllRequestStateParameter,
     AllResponseStateParameter,
     AllStateParameter,
+    HeaderParameter,
+    HeadersParameter,
     Parameter,
 )
 
@@ -47,3 +50,36 @@ def test_AllStateParameter() -> None:
 
     assert parameter.resolve_request(request) is state
     assert parameter.resolve_response(response) is state
+
+
+def test_HeaderParameter_parse_key() -> None:
+    assert HeaderParameter().parse_key("x_name") == "x-name"
+    assert HeaderParameter().parse_key("x-name") == "x-name"
+    assert HeaderParameter(convert_underscores=False).parse_key("x_name") == "x_name"
+
+
+def test_HeadersParameter_compose() -> None:
+    request: RequestOpts = utils.build_pre_request()
+
+    HeadersParameter().compose(request, Headers({"name": "sam"}))
+    HeadersParameter().compose(request, {"age": "43"})
+    HeadersParameter().compose(request, {"id": 123})
+
+    assert request.headers == Headers({"name": "sam", "age": "43", "id": "123"})
+
+
+def test_HeaderParameter_alias_changed() -> None:
+    request: RequestOpts = utils.build_pre_request(headers={"x-name": "sam"})
+
+    parameter: HeaderParameter = HeaderParameter(alias="x_name")
+
+    parameter.compose(request, "bob")
+
+    assert parameter.resolve_request(request) == ["bob"]
+
+    parameter.alias = "x_age"
+
+    parameter.compose(request, "43")
+
+    assert parameter.resolve_request(request) == ["43"]
+    assert request.headers == Headers({"x-name": "bob", "x-age": "43"})
@@ -1,4 +1,7 @@
+import gc
+import weakref
 from types import MethodType
+from typing import List
 
 import pytest
 
@@ -10,7 +13,7 @@ from neoclient.decorators import (
     response_depends,
     service,
 )
-from neoclient.models import ClientOptions
+from neoclient.models import ClientOptions, RequestOpts
 from neoclient.operation import Operation, get_operation
 from neoclient.services import Service
 
@@ -123,3 +126,42 @@ def test_service_response_dependencies() -> None:
         some_response_dependency,
         service.some_service_response_dependency,
     ]
+
+
+def test_call_operation() -> None:
+    class SomeService(Service):
+        @get("/ping")
+        def ping(self) -> RequestOpts: ...
+
+        @get("/users/{item_id}")
+        def user(self, item_id: str) -> RequestOpts: ...
+
+    some_service: SomeService = SomeService()
+
+    assert some_service.ping() == RequestOpts("GET", "/ping")
+    assert some_service.user("1") == RequestOpts(
+        "GET", "/users/{item_id}", path_params={"item_id": "1"}
+    )
+    assert some_service.user(item_id="1") == RequestOpts(
+        "GET", "/users/{item_id}", path_params={"item_id": "1"}
+    )
+
+
+def test_services_collected() -> None:
+    class SomeService(Service):
+        @get("/users/{item_id}")
+        def user(self, item_id: str) -> RequestOpts: ...
+
+    refs: List[weakref.ref] = []
+
+    for _ in range(5):
+        some_service: SomeService = SomeService()
+        some_service.user("1")
+
+        refs.append(weakref.ref(some_service))
+
+        del some_service
+
+    gc.collect()
+
+    assert all(ref() is None for ref in refs)
@@ -1,7 +1,11 @@
-from typing import Mapping, Union
+import functools
+import inspect
+from enum import Enum
+from types import MethodType
+from typing import Any, Callable, Mapping, Optional, Union
 
 import pytest
-from httpx import QueryParams
+from httpx import Headers, QueryParams
 from pydantic.fields import FieldInfo, Undefined
 
 from neoclient import utils
@@ -25,44 +29,35 @@ def test_parse_format_string() -> None:
         utils.parse_format_string("http://foo.com/{bar }")
 
 
-def test_bind_arguments() -> None:
-    def foo(
-        param_1: str,
-        /,
-        param_2: str = "param_2_default",
-        *,
-        param_3: str = "param_3_default",
-    ): ...
+def test_parse_format_string_cached() -> None:
+    utils.parse_format_string("http://foo.com/{bar}")
+
+    hits: int = utils.parse_format_string.cache_info().hits
+
+    assert utils.parse_format_string("http://foo.com/{bar}") == {"bar"}
+    assert utils.parse_format_string.cache_info().hits == hits + 1
+
+
+def test_get_cache_key() -> None:
+    class Foo:
+        def bar(self, baz: str) -> None: ...
+
+    def func() -> None: ...
 
-    assert utils.bind_arguments(foo, ("param_1",), {}) == {
-        "param_1": "param_1",
-        "param_2": "param_2_default",
-        "param_3": "param_3_default",
-    }
-    assert utils.bind_arguments(foo, ("param_1", "param_2"), {}) == {
-        "param_1": "param_1",
-        "param_2": "param_2",
-        "param_3": "param_3_default",
-    }
-    assert utils.bind_arguments(foo, ("param_1",), {"param_2": "param_2"}) == {
-        "param_1": "param_1",
-        "param_2": "param_2",
-        "param_3": "param_3_default",
-    }
-    assert utils.bind_arguments(
-        foo, ("param_1", "param_2"), {"param_3": "param_3"}
-    ) == {
-        "param_1": "param_1",
-        "param_2": "param_2",
-        "param_3": "param_3",
-    }
-    assert utils.bind_arguments(
-        foo, ("param_1",), {"param_2": "param_2", "param_3": "param_3"}
-    ) == {
-        "param_1": "param_1",
-        "param_2": "param_2",
-        "param_3": "param_3",
-    }
+    @functools.wraps(func)
+    def wrapper() -> None: ...
+
+    assert utils.get_cache_key(func) is func
+    assert utils.get_cache_key(wrapper) is func
+    assert utils.get_cache_key(Foo().bar) == utils.get_cache_key(Foo().bar)
+
+    key: Callable = utils.get_cache_key(Foo().bar)
+
+    assert isinstance(key, MethodType)
+    assert key.__self__ is utils.UNBOUND
+    assert inspect.signature(utils.get_cache_key(Foo().bar)) == inspect.signature(
+        Foo().bar
+    )
 
 
 def test_is_primitive() -> None:
@@ -79,6 +74,16 @@ def test_is_primitive() -> None:
     assert not utils.is_primitive(Foo())
 
 
+def test_is_str() -> None:
+    class Name(str, Enum):
+        SAM = "sam"
+
+    assert utils.is_str("sam")
+    assert not utils.is_str(Name.SAM)
+    assert not utils.is_str(123)
+    assert not utils.is_str(None)
+
+
 def test_unpack_arguments() -> None:
     def positional_only(arg: str, /): ...
 
@@ -150,7 +155,59 @@ def test_has_default() -> None:
 def test_parse_obj_as() -> None:
     assert utils.parse_obj_as(str, "123") == "123"
     assert utils.parse_obj_as(str, 123) == "123"
+    assert utils.parse_obj_as(int, 123) == 123
+    assert utils.parse_obj_as(int, "123") == 123
+    assert type(utils.parse_obj_as(float, 1)) is float
+    assert utils.parse_obj_as(dict, {"name": "sam"}) == {"name": "sam"}
+    assert utils.parse_obj_as(Any, ("sam",)) == ("sam",)
     assert utils.parse_obj_as(Union[str, int], "abc") == "abc"  # type: ignore
     assert utils.parse_obj_as(
         Mapping[str, str], QueryParams({"name": "sam", "age": "43"})  # type: ignore
     ) == QueryParams({"name": "sam", "age": "43"})
+
+
+def test_parse_obj_as_reuses_parsing_model() -> None:
+    assert utils.parse_obj_as(int, "123") == 123
+    assert utils._get_parsing_model(int) is utils._get_parsing_model(int)
+
+
+def test_Parser() -> None:
+    parser: utils.Parser[Optional[int]] = utils.Parser(Optional[int])
+
+    assert parser("123") == 123
+    assert parser(None) is None
+    assert parser.model_cls is utils._get_parsing_model(Optional[int])
+
+
+def test_jsonable_encoder() -> None:
+    body: Mapping[str, Any] = {"name": "sam", "tags": ["a", "b"], "age": None}
+
+    assert utils.jsonable_encoder("foo") == "foo"
+    assert utils.jsonable_encoder(body) == body
+    assert utils.jsonable_encoder(body) is not body
+    assert utils.jsonable_encoder(("a", "b")) == ["a", "b"]
+    assert utils.jsonable_encoder({"a": {1, 2}}) == {"a": [1, 2]}
+    assert utils.jsonable_encoder({"a": ("b",)}) == {"a": ["b"]}
+    assert utils.jsonable_encoder({"_sa_state": 1, "a": 2}) == {"a": 2}
+
+
+def test_is_body_annotation() -> None:
+    assert utils.is_body_annotation(dict)
+    assert utils.is_body_annotation(Mapping[str, Any])
+    assert not utils.is_body_annotation(str)
+    assert not utils.is_body_annotation(Union[str, int])
+
+
+def test_get_signature() -> None:
+    def foo(name: str, /, *, age: int = 0) -> None: ...
+
+    assert utils.get_signature(foo) == inspect.signature(foo)
+    assert utils.get_signature(foo) is utils.get_signature(foo)
+
+
+def test_add_headers() -> None:
+    headers: Headers = Headers({"name": "sam"})
+
+    utils.add_headers(headers, Headers((("name", "bob"), ("age", "43"))))
+
+    assert headers.multi_items() == [("name", "sam"), ("name", "bob"), ("age", "43")]